@@ -170,6 +170,21 @@ class Bootstrapper:
                     connection.commit()
 
             _ensure_positions()
+
+            # Created after the position backfill so legacy databases have the column.
+            # The listing queries filter on the parent id and ORDER BY position, id;
+            # these indexes let SQLite walk rows in order instead of sorting them.
+            cursor.executescript(
+                """
+                CREATE INDEX IF NOT EXISTS idx_classes_pos
+                    ON classes(position, id);
+                CREATE INDEX IF NOT EXISTS idx_modules_class_pos
+                    ON modules(class_id, position, id);
+                CREATE INDEX IF NOT EXISTS idx_lectures_module_pos
+                    ON lectures(module_id, position, id);
+                """
+            )
+            connection.commit()
         finally:
             connection.close()
 
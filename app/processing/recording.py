@@ -518,29 +518,31 @@ def _compress_signal(
     attack_coeff = math.exp(-1.0 / (sample_rate * (attack_ms / 1_000))) if attack_ms > 0 else 0.0
     release_coeff = math.exp(-1.0 / (sample_rate * (release_ms / 1_000))) if release_ms > 0 else 0.0
 
+    # The envelope follower is recursive, so it stays a loop, but over plain
+    # floats; the gain curve is then applied to the whole signal at once.
+    samples = np.asarray(signal, dtype=np.float64)
+    attack_mix = 1.0 - attack_coeff
+    release_mix = 1.0 - release_coeff
     envelope = 0.0
-    output = np.zeros_like(signal, dtype=np.float32)
-
-    for index, sample in enumerate(signal):
-        magnitude = abs(float(sample))
+    envelopes = []
+    track = envelopes.append
+    for magnitude in np.abs(samples).tolist():
         if magnitude > envelope:
-            envelope = attack_coeff * envelope + (1.0 - attack_coeff) * magnitude
+            envelope = attack_coeff * envelope + attack_mix * magnitude
         else:
-            envelope = release_coeff * envelope + (1.0 - release_coeff) * magnitude
-
+            envelope = release_coeff * envelope + release_mix * magnitude
         if envelope < 1e-9:
             envelope = 1e-9
-
-        if envelope <= threshold:
-            gain = 1.0
-        else:
-            over_db = 20 * math.log10(envelope / threshold)
-            reduction_db = over_db * (1 - 1 / ratio)
-            gain = 10 ** (-reduction_db / 20)
-
-        output[index] = float(sample) * gain
-
-    return output
+        track(envelope)
+
+    envelope_array = np.asarray(envelopes, dtype=np.float64).reshape(samples.shape)
+    over = envelope_array > threshold
+    if not over.any():
+        return samples.astype(np.float32)
+    gain = np.ones_like(envelope_array)
+    # 10 ** (-(20 * log10(env / threshold)) * (1 - 1 / ratio) / 20), simplified.
+    gain[over] = (envelope_array[over] / threshold) ** (1.0 / ratio - 1.0)
+    return (samples * gain).astype(np.float32)
 
 
 def _shape_frequency_response(
@@ -6,6 +6,7 @@ import inspect
 import json
 import logging
 import math
+import os
 import shutil
 import sys
 import time
@@ -13,13 +14,25 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import fmean
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
-from zipfile import ZIP_DEFLATED, ZipFile
-
-from PIL import Image, ImageFilter, ImageOps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from ..services.ingestion import SlideConversionResult, SlideConverter
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from PIL import Image
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -432,6 +445,8 @@ class PyMuPDFSlideConverter(SlideConverter):
         return int(threshold)
 
     def _build_ocr_variants(self, image: Image.Image) -> List[_OCRVariant]:
+        from PIL import Image, ImageFilter, ImageOps
+
         variants: List[_OCRVariant] = []
         base_image = ImageOps.exif_transpose(image)
         variants.append(_OCRVariant(label="original", image=base_image))
@@ -508,6 +523,13 @@ class PyMuPDFSlideConverter(SlideConverter):
                 "NumPy is required for slide conversion"
             ) from exc
 
+        try:
+            from PIL import Image  # type: ignore
+        except ImportError as exc:  # pragma: no cover - runtime dependency check
+            raise SlideConversionDependencyError(
+                "Pillow is required for slide conversion"
+            ) from exc
+
         LOGGER.debug(
             "Slide OCR pipeline ready (language=%s); OCR backends will be prepared on demand",
             self._ocr_language,
@@ -671,12 +693,11 @@ class PyMuPDFSlideConverter(SlideConverter):
                 full_pix = page.get_pixmap(matrix=matrix, alpha=False)
                 full_image = Image.frombytes("RGB", [full_pix.width, full_pix.height], full_pix.samples)
 
-                array = np.asarray(full_image)
                 image_array_filename: Optional[str] = None
                 if self._retain_debug_assets:
                     image_array_path = asset_dir / f"slide-{page_number + 1:03d}-image.npy"
                     try:
-                        np.save(image_array_path, array)
+                        np.save(image_array_path, np.asarray(full_image))
                     except Exception:  # pragma: no cover - debug persistence best effort
                         LOGGER.exception(
                             "Failed to persist OCR pixel array for slide %s",
@@ -1107,11 +1128,21 @@ class PyMuPDFSlideConverter(SlideConverter):
         with ZipFile(bundle_path, "w", compression=ZIP_DEFLATED) as archive:
             archive.write(markdown_path, arcname=markdown_path.name)
             archive.write(text_path, arcname=text_path.name)
-            for image_file in sorted(asset_dir.iterdir()):
-                if not image_file.is_file():
-                    continue
+            # ``DirEntry.is_file`` reuses the type from the directory read, so
+            # long slide decks avoid a stat call per rendered page.
+            with os.scandir(asset_dir) as entries:
+                image_names = sorted(entry.name for entry in entries if entry.is_file())
+            for image_name in image_names:
+                image_file = asset_dir / image_name
                 arcname = Path(asset_dir.name) / image_file.name
-                archive.write(image_file, arcname=arcname.as_posix())
+                # PNG data is already deflate-compressed; re-deflating it only
+                # burns CPU after the last page has rendered.
+                compress_type = ZIP_STORED if image_file.suffix == ".png" else None
+                archive.write(
+                    image_file,
+                    arcname=arcname.as_posix(),
+                    compress_type=compress_type,
+                )
 
         return SlideConversionResult(bundle_path=bundle_path, markdown_path=markdown_path)
 
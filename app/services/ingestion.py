@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List, Optional, Protocol, Sequence
+from typing import Callable, List, Optional, Protocol, Sequence, Set
 
 from .. import config as config_module
 from ..config import AppConfig
@@ -19,6 +21,12 @@ from .storage import ClassRecord, LectureRecord, LectureRepository, ModuleRecord
 
 LOGGER = logging.getLogger(__name__)
 
+# Lecture roots whose directories were created and write-tested this process.
+_ENSURED_LECTURE_ROOTS: Set[str] = set()
+
+# Upper bound on concurrent copies when a lecture is ingested from several parts.
+_ASSET_COPY_MAX_WORKERS = 4
+
 
 class IngestionError(RuntimeError):
     """Raised when a lecture cannot be ingested."""
@@ -124,6 +132,12 @@ class LecturePaths:
             ("slide", self.slide_dir),
             ("notes", self.notes_dir),
         )
+        root_key = str(self.lecture_root)
+        if root_key in _ENSURED_LECTURE_ROOTS:
+            # Already prepared; only re-run the full check if something was removed.
+            if all(os.path.isdir(path) for _label, path in directories):
+                return
+            _ENSURED_LECTURE_ROOTS.discard(root_key)
         for label, path in directories:
             start = time.perf_counter()
             existed_before = path.exists()
@@ -172,6 +186,7 @@ class LecturePaths:
                 duration_ms=duration_ms,
             )
             LOGGER.debug("Ensured %s path exists and is writable: %s", label, path)
+        _ENSURED_LECTURE_ROOTS.add(root_key)
 class LectureIngestor:
     """Coordinates the ingestion of lecture assets."""
 
@@ -238,9 +253,13 @@ class LectureIngestor:
         lecture_paths.ensure()
         LOGGER.debug("Prepared lecture directory tree at %s", lecture_paths.lecture_root)
 
-        class_record = self._ensure_class(class_name)
-        module_record = self._ensure_module(class_record.id, module_name)
-        lecture_record = self._ensure_lecture(module_record.id, lecture_name, description)
+        # Resolve the whole hierarchy in one unit of work: a single commit
+        # instead of one per created record, and no window for a concurrent
+        # writer to slip in between a lookup and the matching insert.
+        with self._repository.transaction():
+            class_record = self._ensure_class(class_name)
+            module_record = self._ensure_module(class_record.id, module_name)
+            lecture_record = self._ensure_lecture(module_record.id, lecture_name, description)
 
         audio_relative = None
         slide_relative = None
@@ -256,13 +275,21 @@ class LectureIngestor:
                 raise IngestionError("No transcription engine configured for audio ingestion")
 
             multiple_audio = len(audio_sources) > 1
+            audio_jobs: List[tuple[Path, str]] = []
             for index, source in enumerate(audio_sources, start=1):
                 audio_stem_parts = [class_name, module_name, lecture_name, "audio"]
                 if multiple_audio:
                     audio_stem_parts.append(f"part-{index:02d}")
                 audio_stem = build_asset_stem(*audio_stem_parts)
                 LOGGER.debug("Copying uploaded audio file '%s' using stem '%s'", source, audio_stem)
-                copied_name = self._copy_asset(source, lecture_paths.raw_dir, audio_stem)
+                audio_jobs.append((source, audio_stem))
+            audio_names = self._copy_assets(
+                audio_jobs,
+                lecture_paths.raw_dir,
+                preserve_metadata=False,
+            )
+
+            for index, copied_name in enumerate(audio_names, start=1):
                 audio_path = lecture_paths.raw_dir / copied_name
                 audio_relatives.append(
                     audio_path.relative_to(self._config.storage_root).as_posix()
@@ -310,13 +337,17 @@ class LectureIngestor:
                 raise IngestionError("No slide converter configured for slideshow ingestion")
 
             multiple_slides = len(slide_sources) > 1
+            slide_jobs: List[tuple[Path, str]] = []
             for index, source in enumerate(slide_sources, start=1):
                 slide_stem_parts = [class_name, module_name, lecture_name, "slides"]
                 if multiple_slides:
                     slide_stem_parts.append(f"part-{index:02d}")
                 slide_stem = build_asset_stem(*slide_stem_parts)
                 LOGGER.debug("Copying uploaded slide deck '%s' using stem '%s'", source, slide_stem)
-                copied_name = self._copy_asset(source, lecture_paths.raw_dir, slide_stem)
+                slide_jobs.append((source, slide_stem))
+            slide_names = self._copy_assets(slide_jobs, lecture_paths.raw_dir)
+
+            for index, copied_name in enumerate(slide_names, start=1):
                 slide_path = lecture_paths.raw_dir / copied_name
                 slide_relatives.append(
                     slide_path.relative_to(self._config.storage_root).as_posix()
@@ -433,9 +464,18 @@ class LectureIngestor:
                     for item in part_archive.infolist():
                         if item.is_dir():
                             continue
-                        data = part_archive.read(item.filename)
                         arcname = f"{part_prefix}/{item.filename.lstrip('/')}"
-                        archive.writestr(arcname, data)
+                        # Stream each member instead of reading it whole, and
+                        # keep its compression so stored page images are not
+                        # deflated a second time.
+                        member = zipfile.ZipInfo(arcname, date_time=item.date_time)
+                        member.compress_type = item.compress_type
+                        member.external_attr = item.external_attr
+                        member.file_size = item.file_size
+                        with part_archive.open(item) as source, archive.open(
+                            member, "w"
+                        ) as destination:
+                            shutil.copyfileobj(source, destination)
         LOGGER.debug(
             "Combined %d slide bundles into %s", len(conversions), combined_path
         )
@@ -509,7 +549,7 @@ class LectureIngestor:
                     existing.name,
                     existing.id,
                 )
-                self._repository.update_lecture_description(existing.id, description)
+                self._repository.update_lecture(existing.id, description=description)
                 updated = self._repository.get_lecture(existing.id)
                 if updated is not None:
                     LOGGER.debug("Lecture '%s' (id=%s) description updated", updated.name, updated.id)
@@ -533,7 +573,52 @@ class LectureIngestor:
         )
         return record
 
-    def _copy_asset(self, src: Path, destination_dir: Path, stem: str) -> str:
+    def _copy_assets(
+        self,
+        jobs: Sequence[tuple[Path, str]],
+        destination_dir: Path,
+        *,
+        preserve_metadata: bool = True,
+    ) -> List[str]:
+        """Copy ``(source, stem)`` pairs concurrently, returning names in order.
+
+        Every part has its own stem, so the copies never race for a
+        destination and can overlap their I/O on a small thread pool.
+        """
+
+        if len(jobs) <= 1:
+            return [
+                self._copy_asset(
+                    source, destination_dir, stem, preserve_metadata=preserve_metadata
+                )
+                for source, stem in jobs
+            ]
+        with ThreadPoolExecutor(
+            max_workers=min(_ASSET_COPY_MAX_WORKERS, len(jobs))
+        ) as pool:
+            return list(
+                pool.map(
+                    lambda job: self._copy_asset(
+                        job[0], destination_dir, job[1], preserve_metadata=preserve_metadata
+                    ),
+                    jobs,
+                )
+            )
+
+    def _copy_asset(
+        self,
+        src: Path,
+        destination_dir: Path,
+        stem: str,
+        *,
+        preserve_metadata: bool = True,
+    ) -> str:
+        """Copy *src* into *destination_dir* under a timestamped name.
+
+        Large media can skip ``copy2``'s extra ``copystat`` pass with
+        ``preserve_metadata=False``; ``copyfile`` still uses the OS fast path.
+        """
+
         LOGGER.debug(
             "Copying asset from %s to %s using stem '%s'",
             src,
@@ -544,7 +629,10 @@ class LectureIngestor:
             raise IngestionError(f"Asset not found: {src}")
         destination_dir.mkdir(parents=True, exist_ok=True)
         destination = destination_dir / build_timestamped_name(stem, extension=src.suffix)
-        shutil.copy2(src, destination)
+        if preserve_metadata:
+            shutil.copy2(src, destination)
+        else:
+            shutil.copyfile(src, destination)
         LOGGER.debug("Asset copied to %s", destination)
         return destination.name
 
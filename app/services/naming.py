@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+import functools
 import re
 from typing import Optional
 
@@ -13,12 +14,15 @@ __all__ = [
 ]
 
 
+_NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(value: str) -> str:
     """Return a filesystem-friendly representation of *value*."""
 
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-+", "-", value).strip("-")
+    # Runs of separators, including existing dashes, collapse to one dash.
+    value = _NON_SLUG_CHARS.sub("-", value.strip().lower()).strip("-")
     return value or "item"
 
 
@@ -3,26 +3,39 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import itertools
 import logging
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from ..config import AppConfig
 
 
-@dataclass
-class ClassRecord:
+# Records are NamedTuples built with ``_make(row)``: every SELECT lists its
+# columns in field order, so rows map positionally without a kwargs detour.
+class ClassRecord(NamedTuple):
     id: int
     name: str
     description: str
     position: int
 
 
-@dataclass
-class ModuleRecord:
+class ModuleRecord(NamedTuple):
     id: int
     class_id: int
     name: str
@@ -30,8 +43,7 @@ class ModuleRecord:
     position: int
 
 
-@dataclass
-class LectureRecord:
+class LectureRecord(NamedTuple):
     id: int
     module_id: int
     name: str
@@ -45,8 +57,218 @@ class LectureRecord:
     slide_image_dir: Optional[str]
 
 
+class LectureTreeRow(NamedTuple):
+    """One row of the flattened class → module → lecture hierarchy.
+
+    Classes without modules and modules without lectures still produce a row,
+    with the missing levels set to ``None``. Asset columns are reduced to flags.
+    """
+
+    class_id: int
+    class_name: str
+    module_id: Optional[int]
+    module_name: Optional[str]
+    lecture_id: Optional[int]
+    lecture_name: Optional[str]
+    has_audio: bool
+    has_slides: bool
+    has_transcript: bool
+    has_notes: bool
+    has_slide_images: bool
+
+
 _MISSING = object()
 
+# Headroom for the fixed _SQL_* statements plus the UPDATE shapes assembled per
+# call from optional fields (update_lecture_assets alone has 63 of them).
+_STATEMENT_CACHE_SIZE: Final[int] = 256
+
+
+_LECTURE_COLUMNS: Final[str] = """
+    id,
+    module_id,
+    name,
+    description,
+    position,
+    audio_path,
+    processed_audio_path,
+    slide_path,
+    transcript_path,
+    notes_path,
+    slide_image_dir
+"""
+
+_SQL_BEGIN_IMMEDIATE: Final[str] = "BEGIN IMMEDIATE"
+_SQL_PRAGMA_FOREIGN_KEYS: Final[str] = "PRAGMA foreign_keys = ON"
+_SQL_PRAGMA_JOURNAL_WAL: Final[str] = "PRAGMA journal_mode = WAL"
+_SQL_PRAGMA_JOURNAL_DELETE: Final[str] = "PRAGMA journal_mode = DELETE"
+
+# Per-connection tuning; journal_mode is persisted in the file and set separately.
+_CONNECTION_PRAGMAS: Final[Tuple[str, ...]] = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# The INSERTs append at the end by computing MAX(position) + 1 inside the same
+# statement. Passing NULL for id lets SQLite assign the next rowid. RETURNING
+# (SQLite 3.35+) hands back the row's id and position, so callers never depend
+# on lastrowid, which belongs to whatever last wrote on the shared connection.
+_SQL_INSERT_CLASS: Final[str] = """
+    INSERT INTO classes(id, name, description, position)
+    VALUES (?1, ?2, ?3, (SELECT COALESCE(MAX(position), -1) + 1 FROM classes))
+    RETURNING id, position
+"""
+_SQL_FIND_CLASS_BY_NAME: Final[str] = (
+    "SELECT id, name, description, position FROM classes WHERE name = ?"
+)
+_SQL_GET_CLASS: Final[str] = "SELECT id, name, description, position FROM classes WHERE id = ?"
+_SQL_ITER_CLASSES: Final[str] = (
+    "SELECT id, name, description, position FROM classes ORDER BY position, id"
+)
+_SQL_DELETE_CLASS: Final[str] = "DELETE FROM classes WHERE id = ?"
+_SQL_REORDER_CLASS: Final[str] = "UPDATE classes SET position = ? WHERE id = ?"
+
+_SQL_INSERT_MODULE: Final[str] = """
+    INSERT INTO modules(id, class_id, name, description, position)
+    VALUES (
+        ?1, ?2, ?3, ?4,
+        (SELECT COALESCE(MAX(position), -1) + 1 FROM modules WHERE class_id = ?2)
+    )
+    RETURNING id, position
+"""
+_SQL_FIND_MODULE_BY_NAME: Final[str] = (
+    "SELECT id, class_id, name, description, position FROM modules WHERE class_id = ? AND name = ?"
+)
+_SQL_GET_MODULE: Final[str] = (
+    "SELECT id, class_id, name, description, position FROM modules WHERE id = ?"
+)
+_SQL_ITER_MODULES: Final[str] = """
+    SELECT id, class_id, name, description, position
+    FROM modules
+    WHERE class_id = ?
+    ORDER BY position, id
+"""
+_SQL_ITER_ALL_MODULES: Final[str] = """
+    SELECT id, class_id, name, description, position
+    FROM modules
+    ORDER BY class_id, position, id
+"""
+_SQL_DELETE_MODULE: Final[str] = "DELETE FROM modules WHERE id = ?"
+_SQL_REORDER_MODULE: Final[str] = "UPDATE modules SET class_id = ?, position = ? WHERE id = ?"
+
+_SQL_INSERT_LECTURE: Final[str] = f"""
+    INSERT INTO lectures({_LECTURE_COLUMNS})
+    VALUES (
+        ?1, ?2, ?3, ?4,
+        COALESCE(?5, (SELECT COALESCE(MAX(position), -1) + 1 FROM lectures WHERE module_id = ?2)),
+        ?6, ?7, ?8, ?9, ?10, ?11
+    )
+    RETURNING id, position
+"""
+_SQL_NEXT_LECTURE_POSITION: Final[str] = (
+    "SELECT COALESCE(MAX(position), -1) + 1 FROM lectures WHERE module_id = ?"
+)
+_SQL_FIND_LECTURE_BY_NAME: Final[str] = f"""
+    SELECT {_LECTURE_COLUMNS}
+    FROM lectures
+    WHERE module_id = ? AND name = ?
+"""
+_SQL_GET_LECTURE: Final[str] = f"SELECT {_LECTURE_COLUMNS} FROM lectures WHERE id = ?"
+_SQL_ITER_LECTURES: Final[str] = f"""
+    SELECT {_LECTURE_COLUMNS}
+    FROM lectures
+    WHERE module_id = ?
+    ORDER BY position, id
+"""
+_SQL_ITER_ALL_LECTURES: Final[str] = f"""
+    SELECT {_LECTURE_COLUMNS}
+    FROM lectures
+    ORDER BY module_id, position, id
+"""
+# Asset presence as 0/1 flags, so listings never transport the path strings.
+_LECTURE_FLAG_COLUMNS: Final[str] = """
+    IFNULL(lectures.audio_path, '') != '' AS has_audio,
+    IFNULL(lectures.slide_path, '') != '' AS has_slides,
+    IFNULL(lectures.transcript_path, '') != '' AS has_transcript,
+    IFNULL(lectures.notes_path, '') != '' AS has_notes,
+    IFNULL(lectures.slide_image_dir, '') != '' AS has_slide_images
+"""
+_SQL_ITER_FULL_TREE: Final[str] = f"""
+    SELECT
+        classes.id AS class_id,
+        classes.name AS class_name,
+        modules.id AS module_id,
+        modules.name AS module_name,
+        lectures.id AS lecture_id,
+        lectures.name AS lecture_name,
+        {_LECTURE_FLAG_COLUMNS}
+    FROM classes
+    LEFT JOIN modules ON modules.class_id = classes.id
+    LEFT JOIN lectures ON lectures.module_id = modules.id
+    ORDER BY
+        classes.position, classes.id,
+        modules.position, modules.id,
+        lectures.position, lectures.id
+"""
+# Moving a lecture to another module appends it there; SQLite evaluates every
+# right-hand side against the pre-update row, so the CASE sees the old module_id.
+_SQL_UPDATE_LECTURE: Final[str] = """
+    UPDATE lectures SET
+        name = COALESCE(?1, name),
+        description = COALESCE(?2, description),
+        position = CASE
+            WHEN ?3 IS NOT NULL AND ?3 != module_id THEN (
+                SELECT COALESCE(MAX(position), -1) + 1 FROM lectures WHERE module_id = ?3
+            )
+            ELSE position
+        END,
+        module_id = COALESCE(?3, module_id)
+    WHERE id = ?4
+"""
+_SQL_DELETE_LECTURE: Final[str] = "DELETE FROM lectures WHERE id = ?"
+_ASSET_COLUMNS: Final[Tuple[str, ...]] = (
+    "audio_path",
+    "processed_audio_path",
+    "slide_path",
+    "transcript_path",
+    "notes_path",
+    "slide_image_dir",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _assets_update_sql(mask: int) -> str:
+    """Return the UPDATE for the asset columns whose bits are set in ``mask``.
+
+    Reusing the same string object per column set keeps both this formatting
+    and SQLite's prepared-statement cache warm across calls.
+    """
+
+    assignments = ", ".join(
+        f"{column} = ?" for bit, column in enumerate(_ASSET_COLUMNS) if mask & (1 << bit)
+    )
+    return f"UPDATE lectures SET {assignments} WHERE id = ?"
+
+
+# Lecture reorders bind (id, module_id, position) triples; 300 per statement
+# stays under the 999-parameter limit of SQLite builds older than 3.32.
+_REORDER_BATCH_SIZE: Final[int] = 300
+
+
+@functools.lru_cache(maxsize=8)
+def _reorder_lectures_sql(row_count: int) -> str:
+    values = ", ".join(["(?, ?, ?)"] * row_count)
+    return f"""
+        WITH v(id, module_id, position) AS (VALUES {values})
+        UPDATE lectures SET
+            module_id = (SELECT v.module_id FROM v WHERE v.id = lectures.id),
+            position = (SELECT v.position FROM v WHERE v.id = lectures.id)
+        WHERE id IN (SELECT id FROM v)
+    """
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +276,8 @@ LOGGER = logging.getLogger(__name__)
 class LectureRepository:
     """Simple repository exposing CRUD helpers."""
 
+    _wal_databases: set[Path] = set()
+
     def __init__(
         self,
         config: AppConfig,
@@ -62,6 +286,7 @@ class LectureRepository:
     ) -> None:
         self._db_path = config.database_file
         self._event_emitter: Optional[Callable[..., None]] = event_emitter
+        self._local = threading.local()
 
     def configure_event_emitter(self, emitter: Optional[Callable[..., None]]) -> None:
         """Register the callable responsible for emitting debug events."""
@@ -105,6 +330,7 @@ class LectureRepository:
                 self._event_emitter("DB_QUERY", action)  # type: ignore[misc]
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _summarize_sql(statement: str) -> str:
         collapsed = " ".join(statement.strip().split())
         return collapsed[:180] + ("…" if len(collapsed) > 180 else "")
@@ -144,54 +370,139 @@ class LectureRepository:
             return cursor
 
     def _connect(self) -> sqlite3.Connection:
+        """Return this thread's cached connection, opening it on first use."""
+
+        cached: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if cached is not None:
+            return cached
+
         LOGGER.debug("Opening SQLite connection to %s", self._db_path)
         connection: Optional[sqlite3.Connection] = None
         with self._track_db_event(
             "connect", database=str(self._db_path)
         ) as event:
-            connection = sqlite3.connect(self._db_path)
+            connection = sqlite3.connect(
+                self._db_path, cached_statements=_STATEMENT_CACHE_SIZE
+            )
             event.setdefault("sqlite_version", sqlite3.sqlite_version)
         assert connection is not None  # nosec - validated above
-        connection.row_factory = sqlite3.Row
         self._execute(
             connection,
-            "PRAGMA foreign_keys = ON",
+            _SQL_PRAGMA_FOREIGN_KEYS,
             action="pragma_foreign_keys",
         )
-        LOGGER.debug("SQLite connection ready with foreign_keys pragma enabled")
+        if self._db_path not in LectureRepository._wal_databases:
+            self._execute(connection, _SQL_PRAGMA_JOURNAL_WAL, action="pragma_journal_mode")
+            LectureRepository._wal_databases.add(self._db_path)
+        for pragma in _CONNECTION_PRAGMAS:
+            self._execute(connection, pragma, action="pragma_tuning")
+        LOGGER.debug("SQLite connection ready with foreign_keys, WAL and tuning pragmas")
+        self._local.connection = connection
         return connection
 
-    def _next_position(
-        self,
-        connection: sqlite3.Connection,
-        table: str,
-        *,
-        filter_field: Optional[str] = None,
-        filter_value: Optional[int] = None,
-    ) -> int:
-        query = f"SELECT COALESCE(MAX(position), -1) + 1 FROM {table}"
-        params: List[object] = []
-        if filter_field is not None:
-            query += f" WHERE {filter_field} = ?"
-            params.append(filter_value)
-        cursor = self._execute(
-            connection,
-            query,
-            params,
-            action=f"{table}.next_position",
-            table=table,
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return 0
-        next_value = row[0]
-        LOGGER.debug(
-            "Computed next position for %s (filter=%s) -> %s",
-            table,
-            filter_value if filter_field is not None else "<none>",
-            next_value,
-        )
-        return int(next_value or 0)
+    @contextlib.contextmanager
+    def _scoped_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the cached connection, committing on exit unless a unit of work is open.
+
+        Inside :meth:`transaction` the outer block owns the commit, so statements
+        issued here simply join it and errors propagate without a rollback.
+        """
+
+        connection = self._connect()
+        if getattr(self._local, "in_transaction", False):
+            yield connection
+            return
+        with connection:
+            yield connection
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["LectureRepository"]:
+        """Group repository writes on this thread into a single commit.
+
+        Opens ``BEGIN IMMEDIATE`` so the write lock is taken up front, commits when
+        the block exits cleanly and rolls back if it raises. Nested calls join the
+        outermost transaction.
+        """
+
+        if getattr(self._local, "in_transaction", False):
+            yield self
+            return
+
+        connection = self._connect()
+        with self._track_db_event("transaction") as event:
+            self._execute(connection, _SQL_BEGIN_IMMEDIATE, action="transaction.begin")
+            self._local.in_transaction = True
+            try:
+                yield self
+            except BaseException:
+                connection.rollback()
+                event["result"] = "rolled_back"
+                raise
+            else:
+                connection.commit()
+                event["result"] = "committed"
+            finally:
+                self._local.in_transaction = False
+
+    def restore_from(self, source: Path) -> None:
+        """Replace the database contents with those of another SQLite file.
+
+        Uses the SQLite backup API against the live connection so cached
+        handles stay valid, unlike copying over the database file.
+        """
+
+        LOGGER.debug("Restoring database %s from %s", self._db_path, source)
+        with self._track_db_event("restore_from", source=str(source)):
+            source_connection = sqlite3.connect(source)
+            try:
+                source_connection.backup(self._connect())
+            finally:
+                source_connection.close()
+
+    def backup_to(self, destination: Path) -> None:
+        """Write a consistent, self-contained snapshot of the database."""
+
+        LOGGER.debug("Backing up database %s to %s", self._db_path, destination)
+        with self._track_db_event("backup_to", destination=str(destination)):
+            target = sqlite3.connect(destination)
+            try:
+                self._connect().backup(target)
+                target.execute(_SQL_PRAGMA_JOURNAL_DELETE)
+            finally:
+                target.close()
+
+    def close(self) -> None:
+        """Close the calling thread's cached connection, if one is open."""
+
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            return
+        self._local.connection = None
+        connection.close()
+        LOGGER.debug("Closed SQLite connection to %s", self._db_path)
+
+    @contextlib.contextmanager
+    def batch_insert(self, module_id: int) -> Iterator[Iterator[int]]:
+        """Yield a position counter for inserting many lectures into a module.
+
+        ``MAX(position)`` is read once up front; pass ``position=next(counter)`` to
+        :meth:`add_lecture` for each row instead of re-querying on every insert.
+        """
+
+        with self._track_db_event(
+            "batch_insert", table="lectures", module_id=module_id
+        ) as event:
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_NEXT_LECTURE_POSITION,
+                    (module_id,),
+                    action="lectures.next_position",
+                    table="lectures",
+                )
+                start = cursor.fetchone()[0]
+            event["start_position"] = start
+        yield itertools.count(start)
 
     # ---------------------------------------------------------------------
     # Creation helpers
@@ -203,7 +514,7 @@ class LectureRepository:
         *,
         class_id: Optional[int] = None,
     ) -> int:
-        description_length = len(description or "")
+        description_length = len(description) if description else 0
         LOGGER.debug(
             "Adding class '%s' (description length=%s)",
             name,
@@ -215,39 +526,20 @@ class LectureRepository:
             name=name,
             description_length=description_length,
         ) as event:
-            with self._connect() as connection:
-                position = self._next_position(connection, "classes")
-                if class_id is None:
-                    cursor = self._execute(
-                        connection,
-                        "INSERT INTO classes(name, description, position) VALUES (?, ?, ?)",
-                        (name, description, position),
-                        action="classes.insert",
-                        table="classes",
-                    )
-                    inserted_id = int(cursor.lastrowid)
-                else:
-                    cursor = self._execute(
-                        connection,
-                        "INSERT INTO classes(id, name, description, position) VALUES (?, ?, ?, ?)",
-                        (class_id, name, description, position),
-                        action="classes.insert",
-                        table="classes",
-                    )
-                    inserted_id = class_id
-                rowcount = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 1
-                event.update({
-                    "class_id": inserted_id,
-                    "position": position,
-                    "rowcount": int(rowcount),
-                })
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_INSERT_CLASS,
+                    (class_id, name, description),
+                    action="classes.insert",
+                    table="classes",
+                )
+                inserted_id, position = cursor.fetchone()
+                event.update({"class_id": inserted_id, "position": position, "rowcount": 1})
                 LOGGER.debug(
-                    "Class '%s' inserted with id=%s at position=%s",
-                    name,
-                    inserted_id,
-                    position,
+                    "Class '%s' inserted with id=%s at position=%s", name, inserted_id, position
                 )
-                return int(inserted_id)
+                return inserted_id
 
     def update_class(
         self,
@@ -287,7 +579,7 @@ class LectureRepository:
             class_id=class_id,
             changes=len(assignments),
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
                     f"UPDATE classes SET {', '.join(assignments)} WHERE id = ?",
@@ -301,28 +593,29 @@ class LectureRepository:
     def find_class_by_name(self, name: str) -> Optional[ClassRecord]:
         LOGGER.debug("Looking up class by name '%s'", name)
         with self._track_db_event("find_class_by_name", table="classes", name=name) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "SELECT id, name, description, position FROM classes WHERE name = ?",
+                    _SQL_FIND_CLASS_BY_NAME,
                     (name,),
                     action="classes.lookup_by_name",
                     table="classes",
                 )
                 row = cursor.fetchone()
-                found = bool(row)
+                record = ClassRecord._make(row) if row else None
+                found = record is not None
                 event.update(
                     {
                         "found": found,
-                        "class_id": int(row["id"]) if found else None,
+                        "class_id": record.id if record else None,
                         "rowcount": 1 if found else 0,
                     }
                 )
-                if row:
-                    LOGGER.debug("Class '%s' resolved to id=%s", name, row["id"])
+                if record is not None:
+                    LOGGER.debug("Class '%s' resolved to id=%s", name, record.id)
                 else:
                     LOGGER.debug("Class '%s' not found", name)
-                return ClassRecord(**row) if row else None
+                return record
 
     def add_module(
         self,
@@ -332,7 +625,7 @@ class LectureRepository:
         *,
         module_id: Optional[int] = None,
     ) -> int:
-        description_length = len(description or "")
+        description_length = len(description) if description else 0
         LOGGER.debug(
             "Adding module '%s' for class_id=%s (description length=%s)",
             name,
@@ -346,34 +639,16 @@ class LectureRepository:
             name=name,
             description_length=description_length,
         ) as event:
-            with self._connect() as connection:
-                position = self._next_position(
-                    connection, "modules", filter_field="class_id", filter_value=class_id
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_INSERT_MODULE,
+                    (module_id, class_id, name, description),
+                    action="modules.insert",
+                    table="modules",
                 )
-                if module_id is None:
-                    cursor = self._execute(
-                        connection,
-                        "INSERT INTO modules(class_id, name, description, position) VALUES (?, ?, ?, ?)",
-                        (class_id, name, description, position),
-                        action="modules.insert",
-                        table="modules",
-                    )
-                    inserted_id = int(cursor.lastrowid)
-                else:
-                    cursor = self._execute(
-                        connection,
-                        "INSERT INTO modules(id, class_id, name, description, position) VALUES (?, ?, ?, ?, ?)",
-                        (module_id, class_id, name, description, position),
-                        action="modules.insert",
-                        table="modules",
-                    )
-                    inserted_id = module_id
-                rowcount = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 1
-                event.update({
-                    "module_id": inserted_id,
-                    "position": position,
-                    "rowcount": int(rowcount),
-                })
+                inserted_id, position = cursor.fetchone()
+                event.update({"module_id": inserted_id, "position": position, "rowcount": 1})
                 LOGGER.debug(
                     "Module '%s' inserted with id=%s at position=%s for class_id=%s",
                     name,
@@ -381,7 +656,7 @@ class LectureRepository:
                     position,
                     class_id,
                 )
-                return int(inserted_id)
+                return inserted_id
 
     def update_module(
         self,
@@ -425,7 +700,7 @@ class LectureRepository:
             module_id=module_id,
             changes=len(assignments),
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
                     f"UPDATE modules SET {', '.join(assignments)} WHERE id = ?",
@@ -444,33 +719,34 @@ class LectureRepository:
             class_id=class_id,
             name=name,
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "SELECT id, class_id, name, description, position FROM modules WHERE class_id = ? AND name = ?",
+                    _SQL_FIND_MODULE_BY_NAME,
                     (class_id, name),
                     action="modules.lookup_by_name",
                     table="modules",
                 )
                 row = cursor.fetchone()
-                found = bool(row)
+                record = ModuleRecord._make(row) if row else None
+                found = record is not None
                 event.update(
                     {
                         "found": found,
-                        "module_id": int(row["id"]) if found else None,
+                        "module_id": record.id if record else None,
                         "rowcount": 1 if found else 0,
                     }
                 )
-                if row:
+                if record is not None:
                     LOGGER.debug(
                         "Module '%s' resolved to id=%s for class_id=%s",
                         name,
-                        row["id"],
+                        record.id,
                         class_id,
                     )
                 else:
                     LOGGER.debug("Module '%s' not found for class_id=%s", name, class_id)
-                return ModuleRecord(**row) if row else None
+                return record
 
     def add_lecture(
         self,
@@ -479,6 +755,7 @@ class LectureRepository:
         description: str = "",
         *,
         lecture_id: Optional[int] = None,
+        position: Optional[int] = None,
         audio_path: Optional[str] = None,
         processed_audio_path: Optional[str] = None,
         slide_path: Optional[str] = None,
@@ -486,7 +763,7 @@ class LectureRepository:
         notes_path: Optional[str] = None,
         slide_image_dir: Optional[str] = None,
     ) -> int:
-        description_length = len(description or "")
+        description_length = len(description) if description else 0
         LOGGER.debug(
             "Adding lecture '%s' to module_id=%s (description length=%s)",
             name,
@@ -506,83 +783,31 @@ class LectureRepository:
             has_notes=bool(notes_path),
             has_slide_images=bool(slide_image_dir),
         ) as event:
-            with self._connect() as connection:
-                position = self._next_position(
-                    connection, "lectures", filter_field="module_id", filter_value=module_id
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_INSERT_LECTURE,
+                    (
+                        lecture_id,
+                        module_id,
+                        name,
+                        description,
+                        position,
+                        audio_path,
+                        processed_audio_path,
+                        slide_path,
+                        transcript_path,
+                        notes_path,
+                        slide_image_dir,
+                    ),
+                    action="lectures.insert",
+                    table="lectures",
                 )
-                if lecture_id is None:
-                    cursor = self._execute(
-                        connection,
-                        """
-                        INSERT INTO lectures(
-                            module_id,
-                            name,
-                            description,
-                            position,
-                            audio_path,
-                            processed_audio_path,
-                            slide_path,
-                            transcript_path,
-                            notes_path,
-                            slide_image_dir
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            module_id,
-                            name,
-                            description,
-                            position,
-                            audio_path,
-                            processed_audio_path,
-                            slide_path,
-                            transcript_path,
-                            notes_path,
-                            slide_image_dir,
-                        ),
-                        action="lectures.insert",
-                        table="lectures",
-                    )
-                    inserted_id = int(cursor.lastrowid)
-                else:
-                    cursor = self._execute(
-                        connection,
-                        """
-                        INSERT INTO lectures(
-                            id,
-                            module_id,
-                            name,
-                            description,
-                            position,
-                            audio_path,
-                            processed_audio_path,
-                            slide_path,
-                            transcript_path,
-                            notes_path,
-                            slide_image_dir
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            lecture_id,
-                            module_id,
-                            name,
-                            description,
-                            position,
-                            audio_path,
-                            processed_audio_path,
-                            slide_path,
-                            transcript_path,
-                            notes_path,
-                            slide_image_dir,
-                        ),
-                        action="lectures.insert",
-                        table="lectures",
-                    )
-                    inserted_id = lecture_id
-                rowcount = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 1
+                inserted_id, position = cursor.fetchone()
                 event.update({
                     "lecture_id": inserted_id,
                     "position": position,
-                    "rowcount": int(rowcount),
+                    "rowcount": 1,
                 })
                 LOGGER.debug(
                     "Lecture '%s' inserted with id=%s at position=%s for module_id=%s",
@@ -591,7 +816,7 @@ class LectureRepository:
                     position,
                     module_id,
                 )
-                return int(inserted_id)
+                return inserted_id
 
     def find_lecture_by_name(self, module_id: int, name: str) -> Optional[LectureRecord]:
         LOGGER.debug("Looking up lecture '%s' for module_id=%s", name, module_id)
@@ -601,243 +826,222 @@ class LectureRepository:
             module_id=module_id,
             name=name,
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    """
-                    SELECT
-                        id,
-                        module_id,
-                        name,
-                        description,
-                        position,
-                        audio_path,
-                        processed_audio_path,
-                        slide_path,
-                        transcript_path,
-                        notes_path,
-                        slide_image_dir
-                    FROM lectures
-                    WHERE module_id = ? AND name = ?
-                    """,
+                    _SQL_FIND_LECTURE_BY_NAME,
                     (module_id, name),
                     action="lectures.lookup_by_name",
                     table="lectures",
                 )
                 row = cursor.fetchone()
-                found = bool(row)
+                record = LectureRecord._make(row) if row else None
+                found = record is not None
                 event.update(
                     {
                         "found": found,
-                        "lecture_id": int(row["id"]) if found else None,
+                        "lecture_id": record.id if record else None,
                         "rowcount": 1 if found else 0,
                     }
                 )
-                if row:
+                if record is not None:
                     LOGGER.debug(
                         "Lecture '%s' resolved to id=%s for module_id=%s",
                         name,
-                        row["id"],
+                        record.id,
                         module_id,
                     )
                 else:
                     LOGGER.debug("Lecture '%s' not found for module_id=%s", name, module_id)
-                return LectureRecord(**row) if row else None
+                return record
 
     # ------------------------------------------------------------------
     # Iteration helpers
     # ------------------------------------------------------------------
-    def iter_classes(self) -> Iterable[ClassRecord]:
+    # Rows are fetched in one call and mapped through the record's ``_make``,
+    # which is cheaper than resuming a generator frame per row and leaves no
+    # open cursor behind for callers that write while walking the results.
+    def iter_classes(self) -> List[ClassRecord]:
         LOGGER.debug("Iterating over all classes")
         with self._track_db_event("iter_classes", table="classes") as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "SELECT id, name, description, position FROM classes ORDER BY position, id",
+                    _SQL_ITER_CLASSES,
                     action="classes.iter",
                     table="classes",
                 )
-                count = 0
-                for row in cursor.fetchall():
-                    record = ClassRecord(**row)
-                    count += 1
-                    LOGGER.debug(
-                        "Yielding class id=%s name='%s' position=%s",
-                        record.id,
-                        record.name,
-                        record.position,
-                    )
-                    yield record
-                event["rowcount"] = count
+                records = list(map(ClassRecord._make, cursor.fetchall()))
+            event["rowcount"] = len(records)
+            LOGGER.debug("Loaded %d classes", len(records))
+            return records
 
-    def iter_modules(self, class_id: int) -> Iterable[ModuleRecord]:
+    def iter_modules(self, class_id: int) -> List[ModuleRecord]:
         LOGGER.debug("Iterating modules for class_id=%s", class_id)
         with self._track_db_event("iter_modules", table="modules", class_id=class_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    """
-                    SELECT id, class_id, name, description, position
-                    FROM modules
-                    WHERE class_id = ?
-                    ORDER BY position, id
-                    """,
+                    _SQL_ITER_MODULES,
                     (class_id,),
                     action="modules.iter",
                     table="modules",
                 )
-                count = 0
-                for row in cursor.fetchall():
-                    record = ModuleRecord(**row)
-                    count += 1
-                    LOGGER.debug(
-                        "Yielding module id=%s name='%s' class_id=%s position=%s",
-                        record.id,
-                        record.name,
-                        record.class_id,
-                        record.position,
-                    )
-                    yield record
-                event["rowcount"] = count
+                records = list(map(ModuleRecord._make, cursor.fetchall()))
+            event["rowcount"] = len(records)
+            LOGGER.debug("Loaded %d modules for class_id=%s", len(records), class_id)
+            return records
 
-    def iter_lectures(self, module_id: int) -> Iterable[LectureRecord]:
+    def iter_lectures(self, module_id: int) -> List[LectureRecord]:
         LOGGER.debug("Iterating lectures for module_id=%s", module_id)
         with self._track_db_event(
             "iter_lectures", table="lectures", module_id=module_id
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    """
-                    SELECT
-                        id,
-                        module_id,
-                        name,
-                        description,
-                        position,
-                        audio_path,
-                        processed_audio_path,
-                        slide_path,
-                        transcript_path,
-                        notes_path,
-                        slide_image_dir
-                    FROM lectures
-                    WHERE module_id = ?
-                    ORDER BY position, id
-                    """,
+                    _SQL_ITER_LECTURES,
                     (module_id,),
                     action="lectures.iter",
                     table="lectures",
                 )
-                count = 0
-                for row in cursor.fetchall():
-                    record = LectureRecord(**row)
-                    count += 1
-                    LOGGER.debug(
-                        "Yielding lecture id=%s name='%s' module_id=%s position=%s",
-                        record.id,
-                        record.name,
-                        record.module_id,
-                        record.position,
-                    )
-                    yield record
-                event["rowcount"] = count
+                records = list(map(LectureRecord._make, cursor.fetchall()))
+            event["rowcount"] = len(records)
+            LOGGER.debug("Loaded %d lectures for module_id=%s", len(records), module_id)
+            return records
+
+    def iter_all_modules(self) -> List[ModuleRecord]:
+        """Return every module, grouped by class and in display order."""
+
+        LOGGER.debug("Iterating over all modules")
+        with self._track_db_event("iter_all_modules", table="modules") as event:
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_ITER_ALL_MODULES,
+                    action="modules.iter_all",
+                    table="modules",
+                )
+                records = list(map(ModuleRecord._make, cursor.fetchall()))
+            event["rowcount"] = len(records)
+            return records
+
+    def iter_all_lectures(self) -> List[LectureRecord]:
+        """Return every lecture, grouped by module and in display order."""
+
+        LOGGER.debug("Iterating over all lectures")
+        with self._track_db_event("iter_all_lectures", table="lectures") as event:
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_ITER_ALL_LECTURES,
+                    action="lectures.iter_all",
+                    table="lectures",
+                )
+                records = list(map(LectureRecord._make, cursor.fetchall()))
+            event["rowcount"] = len(records)
+            return records
+
+    def iter_full_tree(self) -> List[LectureTreeRow]:
+        """Return the whole hierarchy in display order using a single query."""
+
+        LOGGER.debug("Iterating over the full class/module/lecture tree")
+        with self._track_db_event("iter_full_tree", table="classes") as event:
+            with self._scoped_connection() as connection:
+                cursor = self._execute(
+                    connection,
+                    _SQL_ITER_FULL_TREE,
+                    action="tree.iter",
+                    table="classes",
+                )
+                records = list(map(LectureTreeRow._make, cursor.fetchall()))
+            event["rowcount"] = len(records)
+            return records
 
     def get_class(self, class_id: int) -> Optional[ClassRecord]:
         LOGGER.debug("Fetching class id=%s", class_id)
         with self._track_db_event("get_class", table="classes", class_id=class_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "SELECT id, name, description, position FROM classes WHERE id = ?",
+                    _SQL_GET_CLASS,
                     (class_id,),
                     action="classes.get",
                     table="classes",
                 )
                 row = cursor.fetchone()
-                found = bool(row)
+                record = ClassRecord._make(row) if row else None
+                found = record is not None
                 event.update({"found": found, "rowcount": 1 if found else 0})
-                if row:
-                    LOGGER.debug("Class id=%s resolved to name='%s'", class_id, row["name"])
+                if record is not None:
+                    LOGGER.debug("Class id=%s resolved to name='%s'", class_id, record.name)
                 else:
                     LOGGER.debug("Class id=%s not found", class_id)
-                return ClassRecord(**row) if row else None
+                return record
 
     def get_module(self, module_id: int) -> Optional[ModuleRecord]:
         LOGGER.debug("Fetching module id=%s", module_id)
         with self._track_db_event("get_module", table="modules", module_id=module_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "SELECT id, class_id, name, description, position FROM modules WHERE id = ?",
+                    _SQL_GET_MODULE,
                     (module_id,),
                     action="modules.get",
                     table="modules",
                 )
                 row = cursor.fetchone()
-                found = bool(row)
+                record = ModuleRecord._make(row) if row else None
+                found = record is not None
                 event.update(
                     {
                         "found": found,
-                        "class_id": row["class_id"] if row else None,
+                        "class_id": record.class_id if record else None,
                         "rowcount": 1 if found else 0,
                     }
                 )
-                if row:
+                if record is not None:
                     LOGGER.debug(
                         "Module id=%s resolved to name='%s' (class_id=%s)",
                         module_id,
-                        row["name"],
-                        row["class_id"],
+                        record.name,
+                        record.class_id,
                     )
                 else:
                     LOGGER.debug("Module id=%s not found", module_id)
-                return ModuleRecord(**row) if row else None
+                return record
 
     def get_lecture(self, lecture_id: int) -> Optional[LectureRecord]:
         LOGGER.debug("Fetching lecture id=%s", lecture_id)
         with self._track_db_event("get_lecture", table="lectures", lecture_id=lecture_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    """
-                    SELECT
-                        id,
-                        module_id,
-                        name,
-                        description,
-                        position,
-                        audio_path,
-                        processed_audio_path,
-                        slide_path,
-                        transcript_path,
-                        notes_path,
-                        slide_image_dir
-                    FROM lectures WHERE id = ?
-                    """,
+                    _SQL_GET_LECTURE,
                     (lecture_id,),
                     action="lectures.get",
                     table="lectures",
                 )
                 row = cursor.fetchone()
-                found = bool(row)
+                record = LectureRecord._make(row) if row else None
+                found = record is not None
                 event.update(
                     {
                         "found": found,
-                        "module_id": row["module_id"] if row else None,
+                        "module_id": record.module_id if record else None,
                         "rowcount": 1 if found else 0,
                     }
                 )
-                if row:
+                if record is not None:
                     LOGGER.debug(
                         "Lecture id=%s resolved to name='%s' (module_id=%s)",
                         lecture_id,
-                        row["name"],
-                        row["module_id"],
+                        record.name,
+                        record.module_id,
                     )
                 else:
                     LOGGER.debug("Lecture id=%s not found", lecture_id)
-                return LectureRecord(**row) if row else None
+                return record
 
     def update_lecture(
         self,
@@ -848,86 +1052,31 @@ class LectureRepository:
         module_id: Optional[int] = None,
     ) -> None:
         with self._track_db_event("update_lecture", lecture_id=lecture_id) as event:
-            current = self.get_lecture(lecture_id)
-            if current is None:
-                LOGGER.debug("Skipping update for missing lecture id=%s", lecture_id)
-                event["result"] = "missing"
+            if name is None and description is None and module_id is None:
+                LOGGER.debug("No changes requested for lecture id=%s", lecture_id)
+                event["result"] = "no_changes"
                 return
 
-            assignments: List[str] = []
-            params: List[object] = []
-
-            if name is not None:
-                assignments.append("name = ?")
-                params.append(name)
-            if description is not None:
-                assignments.append("description = ?")
-                params.append(description)
-
-            with self._connect() as connection:
-                if module_id is not None and module_id != current.module_id:
-                    assignments.append("module_id = ?")
-                    params.append(module_id)
-                    new_position = self._next_position(
-                        connection, "lectures", filter_field="module_id", filter_value=module_id
-                    )
-                    assignments.append("position = ?")
-                    params.append(new_position)
-                    LOGGER.debug(
-                        "Lecture id=%s moving to module_id=%s at position=%s",
-                        lecture_id,
-                        module_id,
-                        new_position,
-                    )
-                    event["new_position"] = new_position
-                elif module_id is not None:
-                    assignments.append("module_id = ?")
-                    params.append(module_id)
-
-                if not assignments:
-                    LOGGER.debug("No changes requested for lecture id=%s", lecture_id)
-                    event["result"] = "no_changes"
-                    return
-
-                params.append(lecture_id)
-                query = "UPDATE lectures SET " + ", ".join(assignments) + " WHERE id = ?"
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    query,
-                    params,
+                    _SQL_UPDATE_LECTURE,
+                    (name, description, module_id, lecture_id),
                     action="lectures.update",
                     table="lectures",
                 )
                 affected = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+                if not affected:
+                    LOGGER.debug("Skipping update for missing lecture id=%s", lecture_id)
+                    event["result"] = "missing"
+                    return
                 LOGGER.debug(
-                    "Lecture id=%s updated with assignments=%s", lecture_id, assignments
-                )
-                event.update({
-                    "result": "updated",
-                    "fields_changed": len(assignments),
-                    "rowcount": int(affected),
-                })
-
-    def update_lecture_description(self, lecture_id: int, description: str) -> None:
-        description_length = len(description)
-        LOGGER.debug(
-            "Updating lecture id=%s description (length=%s)", lecture_id, description_length
-        )
-        with self._track_db_event(
-            "update_lecture_description",
-            lecture_id=lecture_id,
-            description_length=description_length,
-        ) as event:
-            with self._connect() as connection:
-                cursor = self._execute(
-                    connection,
-                    "UPDATE lectures SET description = ? WHERE id = ?",
-                    (description, lecture_id),
-                    action="lectures.update_description",
-                    table="lectures",
+                    "Lecture id=%s updated (name=%s, description=%s, module_id=%s)",
+                    lecture_id,
+                    name is not None,
+                    description is not None,
+                    module_id,
                 )
-                affected = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
-                LOGGER.debug("Lecture id=%s description updated", lecture_id)
                 event.update({"result": "updated", "rowcount": int(affected)})
 
     def update_lecture_assets(
@@ -946,35 +1095,25 @@ class LectureRepository:
         Only provided values are updated; omitted ones are left untouched.
         """
 
-        assignments: List[str] = []
-        params: List[Optional[str]] = []
+        values = (
+            audio_path,
+            processed_audio_path,
+            slide_path,
+            transcript_path,
+            notes_path,
+            slide_image_dir,
+        )
+        mask = 0
+        params: List[object] = []
         asset_flags: Dict[str, bool] = {}
-        if audio_path is not _MISSING:
-            assignments.append("audio_path = ?")
-            params.append(audio_path)
-            asset_flags["audio_path"] = bool(audio_path)
-        if processed_audio_path is not _MISSING:
-            assignments.append("processed_audio_path = ?")
-            params.append(processed_audio_path)
-            asset_flags["processed_audio_path"] = bool(processed_audio_path)
-        if slide_path is not _MISSING:
-            assignments.append("slide_path = ?")
-            params.append(slide_path)
-            asset_flags["slide_path"] = bool(slide_path)
-        if transcript_path is not _MISSING:
-            assignments.append("transcript_path = ?")
-            params.append(transcript_path)
-            asset_flags["transcript_path"] = bool(transcript_path)
-        if notes_path is not _MISSING:
-            assignments.append("notes_path = ?")
-            params.append(notes_path)
-            asset_flags["notes_path"] = bool(notes_path)
-        if slide_image_dir is not _MISSING:
-            assignments.append("slide_image_dir = ?")
-            params.append(slide_image_dir)
-            asset_flags["slide_image_dir"] = bool(slide_image_dir)
-
-        if not assignments:
+        for bit, (column, value) in enumerate(zip(_ASSET_COLUMNS, values)):
+            if value is _MISSING:
+                continue
+            mask |= 1 << bit
+            params.append(value)
+            asset_flags[column] = bool(value)
+
+        if not mask:
             LOGGER.debug("No asset updates provided for lecture id=%s", lecture_id)
             with self._track_db_event(
                 "update_lecture_assets", lecture_id=lecture_id, changes=0
@@ -983,14 +1122,13 @@ class LectureRepository:
             return
 
         params.append(lecture_id)
-        query = "UPDATE lectures SET " + ", ".join(assignments) + " WHERE id = ?"
         with self._track_db_event(
-            "update_lecture_assets", lecture_id=lecture_id, changes=len(assignments), **asset_flags
+            "update_lecture_assets", lecture_id=lecture_id, changes=len(asset_flags), **asset_flags
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    query,
+                    _assets_update_sql(mask),
                     params,
                     action="lectures.update_assets",
                     table="lectures",
@@ -999,17 +1137,17 @@ class LectureRepository:
                 LOGGER.debug(
                     "Lecture id=%s asset paths updated (%s)",
                     lecture_id,
-                    ", ".join(assignments),
+                    ", ".join(asset_flags),
                 )
                 event.update({"result": "updated", "rowcount": int(affected)})
 
     def remove_class(self, class_id: int) -> None:
         LOGGER.debug("Removing class id=%s", class_id)
         with self._track_db_event("remove_class", table="classes", class_id=class_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "DELETE FROM classes WHERE id = ?",
+                    _SQL_DELETE_CLASS,
                     (class_id,),
                     action="classes.delete",
                     table="classes",
@@ -1021,10 +1159,10 @@ class LectureRepository:
     def remove_module(self, module_id: int) -> None:
         LOGGER.debug("Removing module id=%s", module_id)
         with self._track_db_event("remove_module", table="modules", module_id=module_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "DELETE FROM modules WHERE id = ?",
+                    _SQL_DELETE_MODULE,
                     (module_id,),
                     action="modules.delete",
                     table="modules",
@@ -1036,10 +1174,10 @@ class LectureRepository:
     def remove_lecture(self, lecture_id: int) -> None:
         LOGGER.debug("Removing lecture id=%s", lecture_id)
         with self._track_db_event("remove_lecture", table="lectures", lecture_id=lecture_id) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 cursor = self._execute(
                     connection,
-                    "DELETE FROM lectures WHERE id = ?",
+                    _SQL_DELETE_LECTURE,
                     (lecture_id,),
                     action="lectures.delete",
                     table="lectures",
@@ -1059,11 +1197,11 @@ class LectureRepository:
         with self._track_db_event(
             "reorder_classes", classes=len(class_ids), changes=len(class_ids)
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 for index, class_id in enumerate(class_ids):
                     self._execute(
                         connection,
-                        "UPDATE classes SET position = ? WHERE id = ?",
+                        _SQL_REORDER_CLASS,
                         (index, class_id),
                         action="classes.reorder",
                         table="classes",
@@ -1087,7 +1225,7 @@ class LectureRepository:
         with self._track_db_event(
             "reorder_modules", classes=len(class_orders), changes=total_updates
         ) as event:
-            with self._connect() as connection:
+            with self._scoped_connection() as connection:
                 for class_id, module_ids in class_orders.items():
                     LOGGER.debug(
                         "Assigning %d modules to class_id=%s", len(module_ids), class_id
@@ -1095,7 +1233,7 @@ class LectureRepository:
                     for position, module_id in enumerate(module_ids):
                         self._execute(
                             connection,
-                            "UPDATE modules SET class_id = ?, position = ? WHERE id = ?",
+                            _SQL_REORDER_MODULE,
                             (class_id, position, module_id),
                             action="modules.reorder",
                             table="modules",
@@ -1118,26 +1256,28 @@ class LectureRepository:
         with self._track_db_event(
             "reorder_lectures", modules=len(module_orders), changes=total_updates
         ) as event:
-            with self._connect() as connection:
-                for module_id, lecture_ids in module_orders.items():
-                    LOGGER.debug(
-                        "Reordering %d lectures for module_id=%s", len(lecture_ids), module_id
+            # Keep only the last placement of a repeated id, matching the old
+            # one-UPDATE-per-id behaviour regardless of where batches split.
+            latest = {
+                lecture_id: (lecture_id, module_id, index)
+                for module_id, lecture_ids in module_orders.items()
+                for index, lecture_id in enumerate(lecture_ids)
+            }
+            rows = list(latest.values())
+            LOGGER.debug(
+                "Reordering %d lectures across %d modules", len(rows), len(module_orders)
+            )
+            with self._scoped_connection() as connection:
+                for start in range(0, len(rows), _REORDER_BATCH_SIZE):
+                    batch = rows[start : start + _REORDER_BATCH_SIZE]
+                    self._execute(
+                        connection,
+                        _reorder_lectures_sql(len(batch)),
+                        tuple(itertools.chain.from_iterable(batch)),
+                        action="lectures.reorder",
+                        table="lectures",
                     )
-                    for index, lecture_id in enumerate(lecture_ids):
-                        self._execute(
-                            connection,
-                            "UPDATE lectures SET module_id = ?, position = ? WHERE id = ?",
-                            (module_id, index, lecture_id),
-                            action="lectures.reorder",
-                            table="lectures",
-                        )
-                        LOGGER.debug(
-                            "Lecture id=%s assigned to module_id=%s position=%s",
-                            lecture_id,
-                            module_id,
-                            index,
-                        )
-            event.update({"result": "reordered", "rowcount": total_updates})
+            event.update({"result": "reordered", "rowcount": len(rows)})
 
 
 __all__ = [
@@ -1145,4 +1285,5 @@ __all__ = [
     "ModuleRecord",
     "LectureRecord",
     "LectureRepository",
+    "LectureTreeRow",
 ]
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import itertools
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Iterable
 
-from ..services.storage import ClassRecord, LectureRecord, LectureRepository, ModuleRecord
+from ..services.storage import LectureRepository, LectureTreeRow
 
 
 @dataclass
@@ -18,6 +19,11 @@ class ConsoleSection:
 class ConsoleUI:
     """Minimal console UI that surfaces stored metadata."""
 
+    _META_LABELS = ("audio", "slides", "transcript", "notes", "slide images")
+    _META_FLAGS = attrgetter(
+        "has_audio", "has_slides", "has_transcript", "has_notes", "has_slide_images"
+    )
+
     def __init__(self, repository: LectureRepository) -> None:
         self._repository = repository
 
@@ -38,49 +44,47 @@ class ConsoleUI:
             print()
 
     def _build_sections(self) -> Iterable[ConsoleSection]:
-        for class_record in self._repository.iter_classes():
+        rows = self._repository.iter_full_tree()
+        for (_, class_name), class_rows in itertools.groupby(
+            rows, key=attrgetter("class_id", "class_name")
+        ):
+            # ``groupby`` invalidates a group once the outer iterator advances,
+            # so each section's entries are rendered before it is handed out.
             yield ConsoleSection(
-                title=f"Class: {class_record.name}",
-                entries=self._format_modules(class_record),
+                title=f"Class: {class_name}",
+                entries=list(self._format_modules(class_rows)),
             )
 
-    def _format_modules(self, class_record: ClassRecord) -> Iterable[str]:
-        modules = list(self._repository.iter_modules(class_record.id))
-        if not modules:
+    def _format_modules(self, class_rows: Iterable[LectureTreeRow]) -> Iterable[str]:
+        has_modules = False
+        for (module_id, module_name), module_rows in itertools.groupby(
+            class_rows, key=attrgetter("module_id", "module_name")
+        ):
+            if module_id is None:
+                break
+            has_modules = True
+            yield from self._format_module_details(module_name, module_rows)
+
+        if not has_modules:
             yield "  No modules registered"
-            return
 
-        for module_record in modules:
-            yield from self._format_module_details(module_record)
-
-    def _format_module_details(self, module_record: ModuleRecord) -> Iterable[str]:
-        lectures = list(self._repository.iter_lectures(module_record.id))
-        header = f"  Module: {module_record.name}"
+    def _format_module_details(
+        self, module_name: str, module_rows: Iterable[LectureTreeRow]
+    ) -> Iterable[str]:
+        lectures = [row for row in module_rows if row.lecture_id is not None]
+        header = f"  Module: {module_name}"
         if not lectures:
             yield f"{header} (no lectures)"
             return
 
         yield header
         for lecture in lectures:
-            yield f"    Lecture: {lecture.name}" + self._format_lecture_meta(lecture)
-
-    @staticmethod
-    def _format_lecture_meta(lecture: LectureRecord) -> str:
-        parts = []
-        if lecture.audio_path:
-            parts.append("audio")
-        if lecture.slide_path:
-            parts.append("slides")
-        if lecture.transcript_path:
-            parts.append("transcript")
-        if lecture.notes_path:
-            parts.append("notes")
-        if lecture.slide_image_dir:
-            parts.append("slide images")
-
-        if not parts:
-            return ""
-        return " (" + ", ".join(parts) + ")"
+            yield f"    Lecture: {lecture.lecture_name}" + self._format_lecture_meta(lecture)
+
+    @classmethod
+    def _format_lecture_meta(cls, lecture: LectureTreeRow) -> str:
+        names = list(itertools.compress(cls._META_LABELS, cls._META_FLAGS(lecture)))
+        return f" ({', '.join(names)})" if names else ""
 
 
 __all__ = ["ConsoleUI"]
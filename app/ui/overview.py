@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from ..services.storage import ClassRecord, LectureRecord, LectureRepository, ModuleRecord
 
@@ -17,6 +18,19 @@ ASSET_LABELS: Dict[str, str] = {
     "slide_images": "🖼️ Slide Images",
 }
 
+# The record field each asset key reflects, in display order.
+_ASSET_FIELDS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (key, field, ASSET_LABELS[key])
+    for key, field in (
+        ("audio", "audio_path"),
+        ("processed_audio", "processed_audio_path"),
+        ("slides", "slide_path"),
+        ("transcript", "transcript_path"),
+        ("notes", "notes_path"),
+        ("slide_images", "slide_image_dir"),
+    )
+)
+
 
 @dataclass
 class LectureOverview:
@@ -48,24 +62,33 @@ class OverviewSnapshot:
 def collect_overview(repository: LectureRepository) -> OverviewSnapshot:
     """Aggregate repository data into a convenient snapshot for UIs."""
 
-    classes: List[ClassOverview] = []
     module_count = 0
     lecture_count = 0
-    asset_totals = {key: 0 for key in ASSET_LABELS.keys()}
-
-    for class_record in repository.iter_classes():
-        modules: List[ModuleOverview] = []
-        for module_record in repository.iter_modules(class_record.id):
-            module_count += 1
-            lectures: List[LectureOverview] = []
-            for lecture_record in repository.iter_lectures(module_record.id):
-                lecture_count += 1
-                assets = _extract_assets(lecture_record, asset_totals)
-                lectures.append(LectureOverview(record=lecture_record, assets=assets))
-
-            modules.append(ModuleOverview(record=module_record, lectures=lectures))
-
-        classes.append(ClassOverview(record=class_record, modules=modules))
+    asset_totals = dict.fromkeys(ASSET_LABELS, 0)
+
+    # One query per table, grouped here, instead of a query per class and module.
+    lectures_by_module: Dict[int, List[LectureOverview]] = defaultdict(list)
+    for lecture_record in repository.iter_all_lectures():
+        lecture_count += 1
+        assets = _extract_assets(lecture_record, asset_totals)
+        lectures_by_module[lecture_record.module_id].append(
+            LectureOverview(record=lecture_record, assets=assets)
+        )
+
+    modules_by_class: Dict[int, List[ModuleOverview]] = defaultdict(list)
+    for module_record in repository.iter_all_modules():
+        module_count += 1
+        modules_by_class[module_record.class_id].append(
+            ModuleOverview(
+                record=module_record,
+                lectures=lectures_by_module.get(module_record.id, []),
+            )
+        )
+
+    classes: List[ClassOverview] = [
+        ClassOverview(record=class_record, modules=modules_by_class.get(class_record.id, []))
+        for class_record in repository.iter_classes()
+    ]
 
     return OverviewSnapshot(
         classes=classes,
@@ -80,25 +103,10 @@ def _extract_assets(
     lecture_record: LectureRecord, asset_totals: Dict[str, int]
 ) -> List[str]:
     assets: List[str] = []
-
-    if lecture_record.audio_path:
-        assets.append(ASSET_LABELS["audio"])
-        asset_totals["audio"] += 1
-    if lecture_record.processed_audio_path:
-        assets.append(ASSET_LABELS["processed_audio"])
-        asset_totals["processed_audio"] += 1
-    if lecture_record.slide_path:
-        assets.append(ASSET_LABELS["slides"])
-        asset_totals["slides"] += 1
-    if lecture_record.transcript_path:
-        assets.append(ASSET_LABELS["transcript"])
-        asset_totals["transcript"] += 1
-    if lecture_record.notes_path:
-        assets.append(ASSET_LABELS["notes"])
-        asset_totals["notes"] += 1
-    if lecture_record.slide_image_dir:
-        assets.append(ASSET_LABELS["slide_images"])
-        asset_totals["slide_images"] += 1
+    for key, field, label in _ASSET_FIELDS:
+        if getattr(lecture_record, field):
+            assets.append(label)
+            asset_totals[key] += 1
 
     return assets
 
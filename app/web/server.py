@@ -6,6 +6,7 @@ import asyncio
 import functools
 import contextlib
 import contextvars
+import io
 import json
 import logging
 import mimetypes
@@ -24,7 +25,7 @@ import traceback
 import uuid
 import zipfile
 from urllib.parse import quote
-from collections import Counter, defaultdict, deque
+from collections import Counter, OrderedDict, defaultdict, deque
 from collections.abc import Mapping, Sequence, Set as AbstractSet
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
@@ -37,6 +38,7 @@ from typing import (
     Deque,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -338,6 +340,15 @@ _SERVER_LOGGER_PREFIXES: Tuple[str, ...] = ("uvicorn", "gunicorn", "hypercorn",
 _SLIDE_PREVIEW_DIR_NAME = ".previews"
 _AUDIO_MANIFEST_FILENAME = "audio_manifest.json"
 _SLIDE_MANIFEST_FILENAME = "slides_manifest.json"
+_SLIDE_MANIFEST_COUNT_CACHE_MAX_ENTRIES = 4096
+_SLIDE_MANIFEST_COUNT_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], int]]" = OrderedDict()
+_SLIDE_MANIFEST_COUNT_CACHE_LOCK = threading.Lock()
+# Rendered pages are full-resolution PNGs, so the cache is bounded by payload
+# bytes rather than entry count.
+_PREVIEW_PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_PREVIEW_PAGE_CACHE: "OrderedDict[Tuple[str, int, int, int, int], bytes]" = OrderedDict()
+_PREVIEW_PAGE_CACHE_BYTES = 0
+_PREVIEW_PAGE_CACHE_LOCK = threading.Lock()
 _SLIDE_PREVIEW_TOKEN_PATTERN = re.compile(r"^[a-f0-9]{16,64}$")
 _DB_SLOW_WARNING_MS = 450.0
 _FILE_SLOW_WARNING_MS = 300.0
@@ -352,6 +363,8 @@ except ValueError:
     _MAX_UPLOAD_BYTES = _DEFAULT_MAX_UPLOAD_BYTES
 
 _DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_SENDFILE_CHUNK_SIZE = 16 * 1024 * 1024
+_FILE_COPY_MAX_WORKERS = 8
 _WHISPER_BENCHMARK_AUDIO_URL = (
     "https://archive.org/download/horse_and_pony_1906_librivox/horseandpony_01_sewell_64kb.mp3"
 )
@@ -477,9 +490,98 @@ def _copy_upload_stream(
         with contextlib.suppress(OSError, ValueError):
             source.seek(0)
     with target.open("wb") as buffer:
+        # When the upload is backed by a real file, let the kernel copy it
+        # instead of bouncing chunks through Python. A spool still held in
+        # memory is left alone: ``fileno()`` would force it onto disk first.
+        if sys.platform.startswith("linux") and getattr(source, "_rolled", True):
+            try:
+                source_fd = source.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                source_fd = None
+            if source_fd is not None:
+                try:
+                    _sendfile_copy(source_fd, buffer.fileno())
+                    return
+                except OSError:
+                    buffer.seek(0)
+                    buffer.truncate()
+                    source.seek(0)
         shutil.copyfileobj(source, buffer, length=chunk_size)
 
 
+def _sendfile_copy(source_fd: int, target_fd: int) -> None:
+    """Copy the whole of ``source_fd`` into ``target_fd`` with ``os.sendfile``."""
+
+    offset = 0
+    remaining = os.fstat(source_fd).st_size
+    while remaining > 0:
+        sent = os.sendfile(target_fd, source_fd, offset, min(remaining, _SENDFILE_CHUNK_SIZE))
+        if sent == 0:
+            break
+        offset += sent
+        remaining -= sent
+
+
+def _iter_file_entries(
+    root: Path, *, follow_file_symlinks: bool = False
+) -> Iterator[os.DirEntry]:
+    """Yield regular files below *root* without recursing into symlinked directories.
+
+    Uses :func:`os.scandir` so file-type checks come from the directory
+    listing instead of a ``stat`` call per entry; unreadable directories are
+    skipped. Symlinks to files are only yielded when ``follow_file_symlinks``
+    is set, so archive and copy walks keep linked assets while size
+    calculations do not count them.
+    """
+
+    pending: List[str] = [os.fspath(root)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=follow_file_symlinks):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _extract_archive(archive_path: Path, destination: Path) -> None:
+    """Extract the zip at ``archive_path`` into ``destination``."""
+
+    with zipfile.ZipFile(archive_path, "r") as bundle:
+        bundle.extractall(destination)
+
+
+def _copy_files_concurrently(
+    pairs: Sequence[Tuple[Path, Path]],
+    *,
+    max_workers: int = _FILE_COPY_MAX_WORKERS,
+) -> List[Tuple[Path, OSError]]:
+    """Copy ``(source, destination)`` pairs on a small thread pool.
+
+    Failed copies are collected and returned rather than aborting the batch.
+    """
+
+    def _copy(pair: Tuple[Path, Path]) -> Optional[Tuple[Path, OSError]]:
+        source, destination = pair
+        try:
+            shutil.copy2(source, destination)
+        except OSError as error:
+            return source, error
+        return None
+
+    if not pairs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+        return [failure for failure in pool.map(_copy, pairs) if failure is not None]
+
+
 async def _persist_upload_file(
     upload: UploadFile,
     target: Path,
@@ -1332,16 +1434,48 @@ def _normalize_cloud_processing_target(value: Any) -> str:
     return _DEFAULT_UI_SETTINGS.cloud_processing_target
 
 
+# Keys of the ``asset_counts`` payloads and the lecture field each one counts.
+_ASSET_COUNT_FIELDS: Dict[str, str] = {
+    "transcripts": "transcript_path",
+    "slides": "slide_path",
+    "audio": "audio_path",
+    "processed_audio": "processed_audio_path",
+    "notes": "notes_path",
+    "slide_images": "slide_image_dir",
+}
+
+
+# Asset endpoints: the lecture field an upload fills and the LecturePaths
+# directory it is written to, the fields each removal clears, and the raw
+# uploads that are additionally tracked in a manifest.
+_ASSET_UPLOAD_TARGETS: Dict[str, Tuple[str, str]] = {
+    "audio": ("audio_path", "raw_dir"),
+    "slides": ("slide_path", "raw_dir"),
+    "transcript": ("transcript_path", "transcript_dir"),
+    "notes": ("notes_path", "notes_dir"),
+    "slide_bundle": ("slide_image_dir", "slide_dir"),
+}
+_ASSET_REMOVAL_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "audio": ("audio_path", "processed_audio_path"),
+    "processed_audio": ("processed_audio_path",),
+    "slides": ("slide_path", "slide_image_dir"),
+    "transcript": ("transcript_path",),
+    "notes": ("notes_path",),
+    "slide_images": ("slide_image_dir",),
+    "slide_bundle": ("slide_image_dir",),
+}
+_RAW_ASSET_MANIFESTS: Dict[str, str] = {
+    "audio": _AUDIO_MANIFEST_FILENAME,
+    "slides": _SLIDE_MANIFEST_FILENAME,
+}
+
+
 def _format_asset_counts(lectures: List[Dict[str, Any]]) -> Dict[str, int]:
     """Return aggregated asset availability counts for a collection of lectures."""
 
     return {
-        "transcripts": sum(1 for lecture in lectures if lecture["transcript_path"]),
-        "slides": sum(1 for lecture in lectures if lecture["slide_path"]),
-        "audio": sum(1 for lecture in lectures if lecture["audio_path"]),
-        "processed_audio": sum(1 for lecture in lectures if lecture["processed_audio_path"]),
-        "notes": sum(1 for lecture in lectures if lecture["notes_path"]),
-        "slide_images": sum(1 for lecture in lectures if lecture["slide_image_dir"]),
+        key: sum(1 for lecture in lectures if lecture[field])
+        for key, field in _ASSET_COUNT_FIELDS.items()
     }
 
 
@@ -1364,10 +1498,14 @@ def _serialize_lecture(lecture: LectureRecord) -> Dict[str, Any]:
     }
 
 
-def _serialize_module(repository: LectureRepository, module: ModuleRecord) -> Dict[str, Any]:
-    lectures: List[Dict[str, Any]] = [
-        _serialize_lecture(lecture) for lecture in repository.iter_lectures(module.id)
-    ]
+def _serialize_module(
+    repository: LectureRepository,
+    module: ModuleRecord,
+    lecture_records: Optional[Iterable[LectureRecord]] = None,
+) -> Dict[str, Any]:
+    if lecture_records is None:
+        lecture_records = repository.iter_lectures(module.id)
+    lectures: List[Dict[str, Any]] = [_serialize_lecture(lecture) for lecture in lecture_records]
     asset_counts = _format_asset_counts(lectures)
     return {
         "id": module.id,
@@ -1381,16 +1519,21 @@ def _serialize_module(repository: LectureRepository, module: ModuleRecord) -> Di
     }
 
 
-def _serialize_class(repository: LectureRepository, class_record: ClassRecord) -> Dict[str, Any]:
-    modules: List[Dict[str, Any]] = [
-        _serialize_module(repository, module) for module in repository.iter_modules(class_record.id)
-    ]
-    lecture_dicts: List[Dict[str, Any]] = [
-        lecture
-        for module in modules
-        for lecture in module["lectures"]
-    ]
-    asset_counts = _format_asset_counts(lecture_dicts)
+def _serialize_class(
+    repository: LectureRepository,
+    class_record: ClassRecord,
+    modules: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    if modules is None:
+        modules = [
+            _serialize_module(repository, module)
+            for module in repository.iter_modules(class_record.id)
+        ]
+    # Roll up the per-module totals rather than re-scanning every lecture.
+    asset_counts = {
+        key: sum(module["asset_counts"][key] for module in modules)
+        for key in _ASSET_COUNT_FIELDS
+    }
     return {
         "id": class_record.id,
         "name": class_record.name,
@@ -1398,10 +1541,32 @@ def _serialize_class(repository: LectureRepository, class_record: ClassRecord) -
         "position": class_record.position,
         "modules": modules,
         "module_count": len(modules),
+        "lecture_count": sum(module["lecture_count"] for module in modules),
         "asset_counts": asset_counts,
     }
 
 
+def _serialize_all_classes(repository: LectureRepository) -> List[Dict[str, Any]]:
+    """Serialize the full hierarchy with one query per table.
+
+    The UI reloads this after every lecture edit or asset change, so it avoids
+    issuing a module query per class and a lecture query per module.
+    """
+
+    lectures_by_module: Dict[int, List[LectureRecord]] = defaultdict(list)
+    for lecture in repository.iter_all_lectures():
+        lectures_by_module[lecture.module_id].append(lecture)
+    modules_by_class: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for module in repository.iter_all_modules():
+        modules_by_class[module.class_id].append(
+            _serialize_module(repository, module, lectures_by_module.get(module.id, ()))
+        )
+    return [
+        _serialize_class(repository, record, modules_by_class.get(record.id, []))
+        for record in repository.iter_classes()
+    ]
+
+
 def _ensure_processing_lecture(
     lecture_id: int,
     *,
@@ -1516,28 +1681,92 @@ def _annotate_slide_manifest_counts(
                     )
                     continue
                 manifest_path = lecture_paths.raw_dir / _SLIDE_MANIFEST_FILENAME
-                if not manifest_path.exists():
+                count = _slide_manifest_count(manifest_path)
+                if count is None:
                     lecture_entry["raw_slide_file_count"] = lecture_entry.get(
                         "raw_slide_file_count", 0
                     )
                     continue
-                try:
-                    raw = manifest_path.read_text(encoding="utf-8")
-                    data = json.loads(raw)
-                except (OSError, json.JSONDecodeError):
-                    lecture_entry["raw_slide_file_count"] = lecture_entry.get(
-                        "raw_slide_file_count", 0
-                    )
-                    continue
-                if isinstance(data, list):
-                    count = sum(
-                        1 for entry in data if isinstance(entry, dict) and entry.get("path")
-                    )
-                else:
-                    count = 0
                 lecture_entry["raw_slide_file_count"] = count
 
 
+def _slide_manifest_count(manifest_path: Path) -> Optional[int]:
+    """Return the number of slide entries in a manifest, or ``None`` if unreadable.
+
+    Counts are cached per path and reused while the file's mtime and size are
+    unchanged, so listing classes does not re-parse every manifest each time.
+    The cache is a bounded LRU so deleted lectures do not leave entries behind
+    for the lifetime of the process.
+    """
+
+    key = str(manifest_path)
+    try:
+        info = os.stat(key)
+    except OSError:
+        with _SLIDE_MANIFEST_COUNT_CACHE_LOCK:
+            _SLIDE_MANIFEST_COUNT_CACHE.pop(key, None)
+        return None
+    signature = (info.st_mtime_ns, info.st_size)
+    with _SLIDE_MANIFEST_COUNT_CACHE_LOCK:
+        cached = _SLIDE_MANIFEST_COUNT_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _SLIDE_MANIFEST_COUNT_CACHE.move_to_end(key)
+            return cached[1]
+
+    try:
+        raw = manifest_path.read_text(encoding="utf-8")
+        data = json.loads(raw)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if isinstance(data, list):
+        count = sum(1 for entry in data if isinstance(entry, dict) and entry.get("path"))
+    else:
+        count = 0
+    with _SLIDE_MANIFEST_COUNT_CACHE_LOCK:
+        _SLIDE_MANIFEST_COUNT_CACHE[key] = (signature, count)
+        _SLIDE_MANIFEST_COUNT_CACHE.move_to_end(key)
+        while len(_SLIDE_MANIFEST_COUNT_CACHE) > _SLIDE_MANIFEST_COUNT_CACHE_MAX_ENTRIES:
+            _SLIDE_MANIFEST_COUNT_CACHE.popitem(last=False)
+    return count
+
+
+def _render_preview_page(preview_path: Path, page_number: int, *, dpi: int) -> bytes:
+    """Render a preview page to PNG, reusing recent renders of unchanged files.
+
+    Rendered pages are kept in an LRU bounded by total payload bytes and keyed
+    on the file's mtime and size, so paging back and forth through a deck does
+    not re-rasterise each page.
+    """
+
+    try:
+        info = preview_path.stat()
+    except OSError as error:
+        raise SlideConversionError("Unable to render PDF page") from error
+    key = (str(preview_path), info.st_mtime_ns, info.st_size, page_number, dpi)
+    with _PREVIEW_PAGE_CACHE_LOCK:
+        cached = _PREVIEW_PAGE_CACHE.get(key)
+        if cached is not None:
+            _PREVIEW_PAGE_CACHE.move_to_end(key)
+            return cached
+
+    global _PREVIEW_PAGE_CACHE_BYTES
+
+    payload = render_pdf_page(preview_path, page_number, dpi=dpi)
+    if len(payload) > _PREVIEW_PAGE_CACHE_MAX_BYTES:
+        return payload
+    with _PREVIEW_PAGE_CACHE_LOCK:
+        # A concurrent render of the same page may already have stored it.
+        replaced = _PREVIEW_PAGE_CACHE.pop(key, None)
+        if replaced is not None:
+            _PREVIEW_PAGE_CACHE_BYTES -= len(replaced)
+        _PREVIEW_PAGE_CACHE[key] = payload
+        _PREVIEW_PAGE_CACHE_BYTES += len(payload)
+        while _PREVIEW_PAGE_CACHE_BYTES > _PREVIEW_PAGE_CACHE_MAX_BYTES:
+            _evicted_key, evicted = _PREVIEW_PAGE_CACHE.popitem(last=False)
+            _PREVIEW_PAGE_CACHE_BYTES -= len(evicted)
+    return payload
+
+
 def _safe_preview_for_path(storage_root: Path, relative_path: Optional[str]) -> Optional[Dict[str, Any]]:
     """Return a preview payload for the provided asset path if available."""
 
@@ -1545,7 +1774,7 @@ def _safe_preview_for_path(storage_root: Path, relative_path: Optional[str]) ->
         return None
 
     candidate = (storage_root / relative_path).resolve()
-    storage_root = storage_root.resolve()
+    storage_root = _resolved_storage_root(storage_root)
     try:
         candidate.relative_to(storage_root)
     except ValueError:
@@ -1594,8 +1823,25 @@ def _normalize_storage_relative_path(value: str) -> str:
     return cleaned
 
 
+def _resolved_storage_root(storage_root: Path) -> Path:
+    """Return the resolved storage root, resolving each absolute root only once.
+
+    The configured root does not move while the app runs, so repeated
+    lookups can skip the ``lstat``/``readlink`` walk that ``resolve()`` does.
+    """
+
+    if not storage_root.is_absolute():
+        return storage_root.resolve()
+    return _resolve_absolute_storage_root(storage_root)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_absolute_storage_root(storage_root: Path) -> Path:
+    return storage_root.resolve()
+
+
 def _resolve_storage_path(_storage_root: Path, relative_path: str) -> Path:
-    root_path = _storage_root.resolve()
+    root_path = _resolved_storage_root(_storage_root)
     relative_path = _normalize_storage_relative_path(relative_path)
     candidate = Path(relative_path)
     if not candidate.is_absolute():
@@ -1606,23 +1852,36 @@ def _resolve_storage_path(_storage_root: Path, relative_path: str) -> Path:
     return candidate
 
 
+def _reveal_on_windows(path: Path, select: bool) -> None:
+    if select and path.exists():
+        subprocess.Popen(["explorer", f"/select,{path}"])
+    else:
+        target = path if path.is_dir() else path.parent
+        subprocess.Popen(["explorer", str(target)])
+
+
+def _reveal_on_macos(path: Path, select: bool) -> None:
+    if select and path.exists():
+        subprocess.Popen(["open", "-R", str(path)])
+    else:
+        subprocess.Popen(["open", str(path)])
+
+
+def _reveal_with_xdg_open(path: Path, select: bool) -> None:
+    target = path if path.is_dir() else (path.parent if select else path)
+    subprocess.Popen(["xdg-open", str(target)])
+
+
+# The host OS cannot change while the server runs, so pick the opener once.
+_REVEAL_IN_FILE_MANAGER: Callable[[Path, bool], None] = {
+    "Windows": _reveal_on_windows,
+    "Darwin": _reveal_on_macos,
+}.get(platform.system(), _reveal_with_xdg_open)
+
+
 def _open_in_file_manager(path: Path, *, select: bool = False) -> None:
-    system = platform.system()
     try:
-        if system == "Windows":
-            if select and path.exists():
-                subprocess.Popen(["explorer", f"/select,{path}"])
-            else:
-                target = path if path.is_dir() else path.parent
-                subprocess.Popen(["explorer", str(target)])
-        elif system == "Darwin":
-            if select and path.exists():
-                subprocess.Popen(["open", "-R", str(path)])
-            else:
-                subprocess.Popen(["open", str(path)])
-        else:
-            target = path if path.is_dir() else (path.parent if select else path)
-            subprocess.Popen(["xdg-open", str(target)])
+        _REVEAL_IN_FILE_MANAGER(path, select)
     except Exception as error:  # pragma: no cover - depends on host platform
         raise RuntimeError(f"Could not reveal path: {error}")
 
@@ -2646,22 +2905,32 @@ def create_app(
             target.chmod(stat.S_IWRITE)
         func(path)
 
-    def _delete_storage_path(target: Path) -> None:
-        storage_root = _require_storage_root().resolve()
+    def _delete_storage_path(target: Path, info: Optional[os.stat_result] = None) -> None:
+        storage_root = _resolved_storage_root(_require_storage_root())
         candidate = target.resolve()
         try:
             candidate.relative_to(storage_root)
         except ValueError:
             return
-        if candidate == storage_root or not candidate.exists():
+        if candidate == storage_root:
             return
-        if candidate.is_dir():
+        if info is None:
+            try:
+                info = candidate.stat()
+            except OSError:
+                return
+        _remove_storage_entry(candidate, info)
+
+    def _remove_storage_entry(candidate: Path, info: os.stat_result) -> None:
+        # ``info`` comes from the caller's single stat so the type check and
+        # the read-only fallback do not hit the filesystem again.
+        if stat.S_ISDIR(info.st_mode):
             shutil.rmtree(candidate, onerror=_handle_remove_readonly)
         else:
             try:
                 candidate.unlink()
             except PermissionError:
-                candidate.chmod(candidate.stat().st_mode | stat.S_IWRITE)
+                candidate.chmod(info.st_mode | stat.S_IWRITE)
                 candidate.unlink()
 
     def _delete_asset_path(relative: Optional[str]) -> None:
@@ -2673,9 +2942,14 @@ def create_app(
         except ValueError:
             return
         start_time = time.perf_counter()
-        existed = asset_path.exists()
-        is_dir = asset_path.is_dir() if existed else None
-        _delete_storage_path(asset_path)
+        try:
+            info: Optional[os.stat_result] = asset_path.stat()
+        except OSError:
+            info = None
+        existed = info is not None
+        is_dir = stat.S_ISDIR(info.st_mode) if info is not None else None
+        if info is not None and asset_path != _resolved_storage_root(root_path):
+            _remove_storage_entry(asset_path, info)
         duration_ms = (time.perf_counter() - start_time) * 1000.0
         _emit_file_event(
             "delete_asset",
@@ -2687,6 +2961,12 @@ def create_app(
             duration_ms=duration_ms,
         )
 
+    def _delete_asset_paths(relatives: Iterable[Optional[str]]) -> None:
+        # Replaced slide image folders can hold hundreds of pages, so callers
+        # run this batch in a worker thread instead of on the event loop.
+        for relative in relatives:
+            _delete_asset_path(relative)
+
     def _collect_archive_metadata() -> Dict[str, Any]:
         classes: List[Dict[str, Any]] = []
         for class_record in repository.iter_classes():
@@ -2727,33 +3007,60 @@ def create_app(
             connection.execute("DELETE FROM classes")
             connection.commit()
 
+    database_artifacts = {
+        config.database_file.resolve().with_name(config.database_file.name + suffix)
+        for suffix in ("", "-journal", "-wal", "-shm")
+    }
+
+    def _is_database_artifact(path: Path) -> bool:
+        # The repository keeps its SQLite handle open, so the live database
+        # files must never be deleted or overwritten through storage copies.
+        return path.resolve() in database_artifacts
+
+    def _contains_database_artifact(path: Path) -> bool:
+        resolved = path.resolve()
+        return any(
+            artifact == resolved or resolved in artifact.parents
+            for artifact in database_artifacts
+        )
+
+    def _write_database_snapshot(bundle: zipfile.ZipFile, path: Path, arcname: str) -> bool:
+        # Committed pages may still sit in the WAL file, so archive a
+        # checkpointed snapshot of the database and skip its side files.
+        if path.name != config.database_file.name:
+            return False
+        with TemporaryDirectory() as snapshot_dir:
+            snapshot_path = Path(snapshot_dir) / path.name
+            repository.backup_to(snapshot_path)
+            bundle.write(snapshot_path, arcname)
+        return True
+
     def _clear_storage() -> None:
-        storage_root = _require_storage_root().resolve()
+        storage_root = _resolved_storage_root(_require_storage_root())
         archive_root = config.archive_root.resolve()
         for child in storage_root.iterdir():
-            if child.resolve() == archive_root:
+            if child.resolve() == archive_root or _is_database_artifact(child):
                 continue
             _delete_storage_path(child)
 
     def _calculate_directory_size(target: Path) -> int:
         total = 0
-        try:
-            for child in target.rglob("*"):
-                if child.is_symlink():
-                    continue
-                try:
-                    if child.is_file():
-                        total += child.stat().st_size
-                except (FileNotFoundError, PermissionError, OSError):
-                    continue
-        except (FileNotFoundError, PermissionError, OSError):
-            return total
+        for entry in _iter_file_entries(target):
+            try:
+                total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
         return total
 
-    def _build_storage_entry(path: Path) -> StorageEntry:
+    def _build_storage_entry(
+        path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> StorageEntry:
         root_path = _require_storage_root()
-        stat_result = path.lstat()
-        is_dir = path.is_dir() and not path.is_symlink()
+        if stat_result is None:
+            stat_result = path.lstat()
+        # ``lstat`` already reports symlinks as non-directories, so the mode
+        # bits answer the type check without further filesystem calls.
+        is_dir = stat.S_ISDIR(stat_result.st_mode)
         size = 0
         if is_dir:
             size = _calculate_directory_size(path)
@@ -3207,10 +3514,10 @@ def create_app(
                 candidate = _resolve_storage_path(storage_root, relative)
             except ValueError:
                 continue
-            if not candidate.exists():
-                continue
             try:
-                size = candidate.stat().st_size
+                size: Optional[int] = candidate.stat().st_size
+            except (FileNotFoundError, NotADirectoryError):
+                continue
             except OSError:
                 size = None
             described.append(
@@ -3363,7 +3670,7 @@ def create_app(
                 )
 
             if len(wav_paths) == 1:
-                shutil.copy2(wav_paths[0], combined_path)
+                shutil.copyfile(wav_paths[0], combined_path)
             else:
                 ffmpeg_path = shutil.which("ffmpeg")
                 if ffmpeg_path is None:
@@ -3420,7 +3727,7 @@ def create_app(
     ) -> LectureStorageSummary:
         total_size = 0
         counted_dirs: List[Path] = []
-        storage_root = root or _require_storage_root().resolve()
+        storage_root = root or _resolved_storage_root(_require_storage_root())
         lecture_storage_path: Optional[str] = None
 
         def _add_directory(path: Path) -> None:
@@ -3450,25 +3757,26 @@ def create_app(
 
         def _add_path(relative: Optional[str]) -> None:
             nonlocal total_size
-            asset = _resolve_existing_asset(relative)
-            if not asset:
+            if not relative:
                 return
             try:
-                resolved = asset.resolve()
-            except (OSError, RuntimeError):
+                resolved = _resolve_storage_path(storage_root, relative)
+            except (ValueError, OSError, RuntimeError):
                 return
             for directory in counted_dirs:
                 if resolved.is_relative_to(directory):
                     return
             if resolved in counted_files:
                 return
-            if resolved.is_dir():
+            # One stat answers existence, type and size together.
+            try:
+                info = resolved.stat()
+            except (OSError, ValueError):
+                return
+            if stat.S_ISDIR(info.st_mode):
                 total_size += _calculate_directory_size(resolved)
             else:
-                try:
-                    total_size += resolved.stat().st_size
-                except (OSError, ValueError):
-                    return
+                total_size += info.st_size
             counted_files.add(resolved)
 
         _add_path(lecture.audio_path)
@@ -3544,6 +3852,12 @@ def create_app(
         for directory in _iter_module_dirs(class_record, module):
             _delete_storage_path(directory)
 
+    def _purge_class_storage(class_record: ClassRecord, modules: List[ModuleRecord]) -> None:
+        for module in modules:
+            _purge_module_storage(class_record, module)
+        for directory in _iter_class_dirs(class_record):
+            _delete_storage_path(directory)
+
     def _reuse_existing_slide_archive(candidates: List[Path]) -> Optional[str]:
         root_path = _require_storage_root()
         prioritized: List[Path] = []
@@ -3572,9 +3886,10 @@ def create_app(
         if not preview_dir.exists() or not preview_dir.is_dir():
             return None
         prefix = f"{token}-"
-        for candidate in preview_dir.iterdir():
-            if candidate.is_file() and candidate.name.startswith(prefix):
-                return candidate
+        with os.scandir(preview_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_file():
+                    return Path(entry.path)
         return None
 
     def _delete_preview_file(preview_dir: Path, token: str) -> bool:
@@ -4298,25 +4613,21 @@ def create_app(
     @app.get("/api/classes")
     async def list_classes() -> Dict[str, Any]:
         _log_event("Listing classes")
-        classes = [_serialize_class(repository, record) for record in repository.iter_classes()]
+        classes = _serialize_all_classes(repository)
         _annotate_slide_manifest_counts(classes, config.storage_root)
         total_modules = sum(item["module_count"] for item in classes)
-        total_lectures = sum(
-            module["lecture_count"] for item in classes for module in item["modules"]
-        )
+        total_lectures = sum(item["lecture_count"] for item in classes)
+        class_totals = {
+            key: sum(klass["asset_counts"][key] for klass in classes)
+            for key in _ASSET_COUNT_FIELDS
+        }
         total_asset_counts = {
-            "transcript_count": sum(
-                klass["asset_counts"]["transcripts"] for klass in classes
-            ),
-            "slide_count": sum(klass["asset_counts"]["slides"] for klass in classes),
-            "audio_count": sum(klass["asset_counts"]["audio"] for klass in classes),
-            "processed_audio_count": sum(
-                klass["asset_counts"].get("processed_audio", 0) for klass in classes
-            ),
-            "notes_count": sum(klass["asset_counts"]["notes"] for klass in classes),
-            "slide_image_count": sum(
-                klass["asset_counts"]["slide_images"] for klass in classes
-            ),
+            "transcript_count": class_totals["transcripts"],
+            "slide_count": class_totals["slides"],
+            "audio_count": class_totals["audio"],
+            "processed_audio_count": class_totals["processed_audio"],
+            "notes_count": class_totals["notes"],
+            "slide_image_count": class_totals["slide_images"],
         }
         _log_event(
             "Summarised classes",
@@ -4391,10 +4702,8 @@ def create_app(
             raise HTTPException(status_code=404, detail="Class not found")
         modules = list(repository.iter_modules(class_id))
         try:
-            for module in modules:
-                _purge_module_storage(record, module)
-            for directory in _iter_class_dirs(record):
-                _delete_storage_path(directory)
+            # Recursive deletes can take a while; keep them off the event loop.
+            await asyncio.to_thread(_purge_class_storage, record, modules)
         except OSError as error:
             raise HTTPException(
                 status_code=500,
@@ -4503,7 +4812,7 @@ def create_app(
         if class_record is None:
             raise HTTPException(status_code=404, detail="Class not found")
         try:
-            _purge_module_storage(class_record, record)
+            await asyncio.to_thread(_purge_module_storage, class_record, record)
         except OSError as error:
             raise HTTPException(
                 status_code=500,
@@ -4707,7 +5016,7 @@ def create_app(
             raise HTTPException(status_code=404, detail="Lecture not found")
         class_record, module = _require_hierarchy(lecture)
         try:
-            _purge_lecture_storage(lecture, class_record, module)
+            await asyncio.to_thread(_purge_lecture_storage, lecture, class_record, module)
         except OSError as error:
             raise HTTPException(
                 status_code=500,
@@ -4733,6 +5042,11 @@ def create_app(
         if lecture is None:
             raise HTTPException(status_code=404, detail="Lecture not found")
 
+        asset_key = asset_type.lower()
+        upload_target = _ASSET_UPLOAD_TARGETS.get(asset_key)
+        if upload_target is None:
+            raise HTTPException(status_code=400, detail="Unsupported asset type")
+
         class_record, module = _require_hierarchy(lecture)
         storage_root = _require_storage_root()
         lecture_paths = LecturePaths.build(
@@ -4743,18 +5057,8 @@ def create_app(
         )
         lecture_paths.ensure()
 
-        asset_key = asset_type.lower()
-        destinations = {
-            "audio": ("audio_path", lecture_paths.raw_dir),
-            "slides": ("slide_path", lecture_paths.raw_dir),
-            "transcript": ("transcript_path", lecture_paths.transcript_dir),
-            "notes": ("notes_path", lecture_paths.notes_dir),
-            "slide_bundle": ("slide_image_dir", lecture_paths.slide_dir),
-        }
-        if asset_key not in destinations:
-            raise HTTPException(status_code=400, detail="Unsupported asset type")
-
-        attribute, destination = destinations[asset_key]
+        attribute, directory_field = upload_target
+        destination: Path = getattr(lecture_paths, directory_field)
         destination.mkdir(parents=True, exist_ok=True)
         original_name = Path(file.filename or "").name
         suffix = Path(original_name).suffix if original_name else Path(file.filename or "").suffix
@@ -4786,51 +5090,44 @@ def create_app(
 
         raw_audio_payload: List[Dict[str, Any]] = []
         raw_slide_payload: List[Dict[str, Any]] = []
-
-        if asset_key == "audio":
-            manifest_path = lecture_paths.raw_dir / _AUDIO_MANIFEST_FILENAME
-            uploaded_at = datetime.now(timezone.utc).isoformat()
+        manifest_name = _RAW_ASSET_MANIFESTS.get(asset_key)
+        if manifest_name is not None:
+            manifest_path = lecture_paths.raw_dir / manifest_name
             _upsert_manifest_entry(
                 manifest_path,
                 path=relative,
                 name=original_name or candidate_name,
-                uploaded_at=uploaded_at,
+                uploaded_at=datetime.now(timezone.utc).isoformat(),
             )
             manifest_entries = _prune_manifest_entries(manifest_path, storage_root)
-            raw_audio_payload = _describe_manifest_entries(manifest_entries, storage_root)
+            if asset_key == "audio":
+                raw_audio_payload = _describe_manifest_entries(manifest_entries, storage_root)
+            else:
+                raw_slide_payload = _describe_manifest_entries(manifest_entries, storage_root)
+
+        stale_paths: List[Optional[str]] = []
+        if asset_key == "audio":
             if lecture.audio_path and lecture.audio_path != relative:
-                _delete_asset_path(lecture.audio_path)
-            if lecture.processed_audio_path:
-                _delete_asset_path(lecture.processed_audio_path)
+                stale_paths.append(lecture.audio_path)
+            stale_paths.append(lecture.processed_audio_path)
             update_kwargs["audio_path"] = None
             update_kwargs["processed_audio_path"] = None
             processed_relative = None
 
         elif asset_key == "slides":
-            manifest_path = lecture_paths.raw_dir / _SLIDE_MANIFEST_FILENAME
-            uploaded_at = datetime.now(timezone.utc).isoformat()
-            _upsert_manifest_entry(
-                manifest_path,
-                path=relative,
-                name=original_name or candidate_name,
-                uploaded_at=uploaded_at,
-            )
-            manifest_entries = _prune_manifest_entries(manifest_path, storage_root)
-            raw_slide_payload = _describe_manifest_entries(manifest_entries, storage_root)
-            if lecture.slide_path:
-                _delete_asset_path(lecture.slide_path)
-            if lecture.slide_image_dir:
-                _delete_asset_path(lecture.slide_image_dir)
+            stale_paths.extend((lecture.slide_path, lecture.slide_image_dir))
             update_kwargs["slide_path"] = None
             update_kwargs["slide_image_dir"] = None
         elif asset_key == "slide_bundle":
-            if lecture.slide_image_dir:
-                _delete_asset_path(lecture.slide_image_dir)
+            stale_paths.append(lecture.slide_image_dir)
             update_kwargs["slide_image_dir"] = relative
 
         else:
             update_kwargs[attribute] = relative
 
+        if any(stale_paths):
+            await asyncio.to_thread(_delete_asset_paths, stale_paths)
+
         repository.update_lecture_assets(lecture_id, **update_kwargs)
         updated = repository.get_lecture(lecture_id)
         if updated is None:
@@ -4928,6 +5225,11 @@ def create_app(
         if lecture is None:
             raise HTTPException(status_code=404, detail="Lecture not found")
 
+        asset_key = asset_type.lower()
+        attributes = _ASSET_REMOVAL_FIELDS.get(asset_key)
+        if attributes is None:
+            raise HTTPException(status_code=400, detail="Unsupported asset type")
+
         class_record, module = _require_hierarchy(lecture)
         storage_root = _require_storage_root()
         lecture_paths = LecturePaths.build(
@@ -4936,22 +5238,6 @@ def create_app(
             module.name,
             lecture.name,
         )
-
-        asset_key = asset_type.lower()
-        removal_map: Dict[str, Tuple[str, ...]] = {
-            "audio": ("audio_path", "processed_audio_path"),
-            "processed_audio": ("processed_audio_path",),
-            "slides": ("slide_path", "slide_image_dir"),
-            "transcript": ("transcript_path",),
-            "notes": ("notes_path",),
-            "slide_images": ("slide_image_dir",),
-            "slide_bundle": ("slide_image_dir",),
-        }
-
-        if asset_key not in removal_map:
-            raise HTTPException(status_code=400, detail="Unsupported asset type")
-
-        attributes = removal_map[asset_key]
         paths_to_remove: Set[str] = set()
         update_kwargs: Dict[str, Optional[str]] = {}
 
@@ -4961,21 +5247,15 @@ def create_app(
                 paths_to_remove.add(str(current))
             update_kwargs[attribute] = None
 
-        if asset_key == "audio":
-            manifest_path = lecture_paths.raw_dir / _AUDIO_MANIFEST_FILENAME
+        manifest_name = _RAW_ASSET_MANIFESTS.get(asset_key)
+        if manifest_name is not None:
+            manifest_path = lecture_paths.raw_dir / manifest_name
             manifest_entries = _prune_manifest_entries(manifest_path, storage_root)
             manifest_paths = {entry.get("path") for entry in manifest_entries if entry.get("path")}
             paths_to_remove.update(manifest_paths)
-            _remove_manifest_paths(manifest_path, {path for path in manifest_paths if path})
-        elif asset_key == "slides":
-            manifest_path = lecture_paths.raw_dir / _SLIDE_MANIFEST_FILENAME
-            manifest_entries = _prune_manifest_entries(manifest_path, storage_root)
-            manifest_paths = {entry.get("path") for entry in manifest_entries if entry.get("path")}
-            paths_to_remove.update(manifest_paths)
-            _remove_manifest_paths(manifest_path, {path for path in manifest_paths if path})
+            _remove_manifest_paths(manifest_path, manifest_paths)
 
-        for relative_path in paths_to_remove:
-            _delete_asset_path(relative_path)
+        await asyncio.to_thread(_delete_asset_paths, paths_to_remove)
 
         repository.update_lecture_assets(lecture_id, **update_kwargs)
         updated = repository.get_lecture(lecture_id)
@@ -5231,25 +5511,36 @@ def create_app(
         filename = build_timestamped_name("lecture-tools-export", extension="zip")
         archive_path = archive_root / filename
 
-        storage_root = _require_storage_root().resolve()
+        storage_root = _resolved_storage_root(_require_storage_root())
         exclude_root = archive_root.resolve()
+        resolved_archive = archive_path.resolve()
+
+        def _write_export_archive() -> None:
+            # Most of the payload is already-compressed audio, PDFs and PNGs,
+            # so a light deflate level keeps nearly all of the size benefit
+            # at a fraction of the CPU time.
+            with zipfile.ZipFile(
+                archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as bundle:
+                bundle.writestr("metadata.json", json.dumps(metadata, ensure_ascii=False, indent=2))
+                if storage_root.exists():
+                    for entry in _iter_file_entries(storage_root, follow_file_symlinks=True):
+                        path = Path(entry.path)
+                        resolved = path.resolve()
+                        if resolved == resolved_archive:
+                            continue
+                        if resolved == exclude_root or exclude_root in resolved.parents:
+                            continue
+                        arcname = Path("storage") / path.relative_to(storage_root)
+                        if resolved in database_artifacts:
+                            _write_database_snapshot(bundle, path, arcname.as_posix())
+                            continue
+                        try:
+                            bundle.write(path, arcname.as_posix())
+                        except OSError:
+                            continue
 
-        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
-            bundle.writestr("metadata.json", json.dumps(metadata, ensure_ascii=False, indent=2))
-            if storage_root.exists():
-                for path in storage_root.rglob("*"):
-                    if path.is_dir():
-                        continue
-                    resolved = path.resolve()
-                    if resolved == archive_path.resolve():
-                        continue
-                    if resolved == exclude_root or exclude_root in resolved.parents:
-                        continue
-                    arcname = Path("storage") / path.relative_to(storage_root)
-                    try:
-                        bundle.write(path, arcname.as_posix())
-                    except OSError:
-                        continue
+        await asyncio.to_thread(_write_export_archive)
 
         root_path = _require_storage_root()
         relative = archive_path.relative_to(root_path).as_posix()
@@ -5300,8 +5591,7 @@ def create_app(
             temp_path = Path(temp_dir) / "archive.zip"
             temp_path.write_bytes(payload)
             try:
-                with zipfile.ZipFile(temp_path, "r") as bundle:
-                    bundle.extractall(temp_dir)
+                await asyncio.to_thread(_extract_archive, temp_path, Path(temp_dir))
             except zipfile.BadZipFile as error:
                 raise HTTPException(status_code=400, detail="Invalid archive") from error
 
@@ -5317,21 +5607,33 @@ def create_app(
             files_root = Path(temp_dir) / "storage"
 
             if normalized_mode == "replace":
-                _clear_database()
-                _clear_storage()
+                await asyncio.to_thread(_clear_database)
+                await asyncio.to_thread(_clear_storage)
 
             root_path = _require_storage_root()
 
             if files_root.exists():
-                for path in files_root.rglob("*"):
-                    if path.is_dir():
-                        continue
+                copy_pairs: List[Tuple[Path, Path]] = []
+                database_snapshot: Optional[Path] = None
+                for entry in _iter_file_entries(files_root, follow_file_symlinks=True):
+                    path = Path(entry.path)
                     destination = root_path / path.relative_to(files_root)
-                    destination.parent.mkdir(parents=True, exist_ok=True)
-                    try:
-                        shutil.copy2(path, destination)
-                    except OSError:
+                    if _is_database_artifact(destination):
+                        if normalized_mode == "replace" and destination.name == config.database_file.name:
+                            database_snapshot = path
                         continue
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    copy_pairs.append((path, destination))
+                if database_snapshot is not None:
+                    await asyncio.to_thread(repository.restore_from, database_snapshot)
+                failures = await asyncio.to_thread(_copy_files_concurrently, copy_pairs)
+                if failures:
+                    LOGGER.warning(
+                        "Skipped %d archive file(s) that could not be copied; first: %s (%s)",
+                        len(failures),
+                        failures[0][0],
+                        failures[0][1],
+                    )
 
             classes_data = metadata.get("classes", [])
             classes_data = sorted(
@@ -5339,124 +5641,137 @@ def create_app(
                 key=lambda item: item.get("position") if isinstance(item.get("position"), int) else 0,
             )
 
-            imported_classes = 0
-            imported_modules = 0
-            imported_lectures = 0
-
-            for class_entry in classes_data:
-                name = str(class_entry.get("name") or "").strip()
-                if not name:
-                    continue
-                description = class_entry.get("description") or ""
-
-                modules_data = class_entry.get("modules", [])
-                modules_data = sorted(
-                    modules_data,
-                    key=lambda item: item.get("position") if isinstance(item.get("position"), int) else 0,
-                )
-
-                if normalized_mode == "merge":
-                    existing_class = repository.find_class_by_name(name)
-                    if existing_class is not None:
-                        class_id = existing_class.id
-                    else:
-                        class_id = repository.add_class(name, description)
-                        imported_classes += 1
-                else:
-                    try:
-                        class_id = repository.add_class(name, description)
-                    except sqlite3.IntegrityError:
-                        existing_class = repository.find_class_by_name(name)
-                        if existing_class is None:
-                            raise
-                        class_id = existing_class.id
-                    imported_classes += 1
-
-                for module_entry in modules_data:
-                    module_name = str(module_entry.get("name") or "").strip()
-                    if not module_name:
-                        continue
-                    module_description = module_entry.get("description") or ""
-
-                    lectures_data = module_entry.get("lectures", [])
-                    lectures_data = sorted(
-                        lectures_data,
-                        key=lambda item: item.get("position") if isinstance(item.get("position"), int) else 0,
-                    )
-
-                    if normalized_mode == "merge":
-                        existing_module = repository.find_module_by_name(class_id, module_name)
-                        if existing_module is not None:
-                            module_id = existing_module.id
-                        else:
-                            module_id = repository.add_module(class_id, module_name, module_description)
-                            imported_modules += 1
-                    else:
-                        try:
-                            module_id = repository.add_module(
-                                class_id, module_name, module_description
-                            )
-                        except sqlite3.IntegrityError:
-                            existing_module = repository.find_module_by_name(class_id, module_name)
-                            if existing_module is None:
-                                raise
-                            module_id = existing_module.id
-                        imported_modules += 1
-
-                    for lecture_entry in lectures_data:
-                        lecture_name = str(lecture_entry.get("name") or "").strip()
-                        if not lecture_name:
+            def _merge_metadata() -> Tuple[int, int, int]:
+                imported_classes = 0
+                imported_modules = 0
+                imported_lectures = 0
+
+                # One commit for the whole archive instead of one per class,
+                # module and lecture; the connection is per thread, so the
+                # whole unit of work runs inside this worker.
+                with repository.transaction():
+                    for class_entry in classes_data:
+                        name = str(class_entry.get("name") or "").strip()
+                        if not name:
                             continue
-                        lecture_description = lecture_entry.get("description") or ""
-
-                        assets = {
-                            "audio_path": lecture_entry.get("audio_path"),
-                            "slide_path": lecture_entry.get("slide_path"),
-                            "transcript_path": lecture_entry.get("transcript_path"),
-                            "notes_path": lecture_entry.get("notes_path"),
-                            "slide_image_dir": lecture_entry.get("slide_image_dir"),
-                        }
+                        description = class_entry.get("description") or ""
+
+                        modules_data = class_entry.get("modules", [])
+                        modules_data = sorted(
+                            modules_data,
+                            key=lambda item: item.get("position") if isinstance(item.get("position"), int) else 0,
+                        )
 
                         if normalized_mode == "merge":
-                            existing_lecture = repository.find_lecture_by_name(module_id, lecture_name)
-                            if existing_lecture is not None:
-                                repository.update_lecture(
-                                    existing_lecture.id,
-                                    description=lecture_description if lecture_description else None,
-                                )
-                                asset_updates = {
-                                    key: value
-                                    for key, value in assets.items()
-                                    if value
-                                }
-                                if asset_updates:
-                                    repository.update_lecture_assets(existing_lecture.id, **asset_updates)
+                            existing_class = repository.find_class_by_name(name)
+                            if existing_class is not None:
+                                class_id = existing_class.id
+                            else:
+                                class_id = repository.add_class(name, description)
+                                imported_classes += 1
+                        else:
+                            try:
+                                class_id = repository.add_class(name, description)
+                            except sqlite3.IntegrityError:
+                                existing_class = repository.find_class_by_name(name)
+                                if existing_class is None:
+                                    raise
+                                class_id = existing_class.id
+                            imported_classes += 1
+
+                        for module_entry in modules_data:
+                            module_name = str(module_entry.get("name") or "").strip()
+                            if not module_name:
                                 continue
+                            module_description = module_entry.get("description") or ""
 
-                        try:
-                            lecture_id = repository.add_lecture(
-                                module_id,
-                                lecture_name,
-                                lecture_description,
-                                audio_path=assets["audio_path"],
-                                slide_path=assets["slide_path"],
-                                transcript_path=assets["transcript_path"],
-                                notes_path=assets["notes_path"],
-                                slide_image_dir=assets["slide_image_dir"],
-                            )
-                        except sqlite3.IntegrityError:
-                            existing = repository.find_lecture_by_name(module_id, lecture_name)
-                            if existing is None:
-                                raise
-                            repository.update_lecture(
-                                existing.id,
-                                description=lecture_description if lecture_description else None,
+                            lectures_data = module_entry.get("lectures", [])
+                            lectures_data = sorted(
+                                lectures_data,
+                                key=lambda item: item.get("position") if isinstance(item.get("position"), int) else 0,
                             )
-                            asset_updates = {key: value for key, value in assets.items() if value}
-                            if asset_updates:
-                                repository.update_lecture_assets(existing.id, **asset_updates)
-                            lecture_id = existing.id
-                        imported_lectures += 1
+
+                            if normalized_mode == "merge":
+                                existing_module = repository.find_module_by_name(class_id, module_name)
+                                if existing_module is not None:
+                                    module_id = existing_module.id
+                                else:
+                                    module_id = repository.add_module(class_id, module_name, module_description)
+                                    imported_modules += 1
+                            else:
+                                try:
+                                    module_id = repository.add_module(
+                                        class_id, module_name, module_description
+                                    )
+                                except sqlite3.IntegrityError:
+                                    existing_module = repository.find_module_by_name(class_id, module_name)
+                                    if existing_module is None:
+                                        raise
+                                    module_id = existing_module.id
+                                imported_modules += 1
+
+                            with repository.batch_insert(module_id) as positions:
+                                for lecture_entry in lectures_data:
+                                    lecture_name = str(lecture_entry.get("name") or "").strip()
+                                    if not lecture_name:
+                                        continue
+                                    lecture_description = lecture_entry.get("description") or ""
+
+                                    assets = {
+                                        "audio_path": lecture_entry.get("audio_path"),
+                                        "slide_path": lecture_entry.get("slide_path"),
+                                        "transcript_path": lecture_entry.get("transcript_path"),
+                                        "notes_path": lecture_entry.get("notes_path"),
+                                        "slide_image_dir": lecture_entry.get("slide_image_dir"),
+                                    }
+
+                                    if normalized_mode == "merge":
+                                        existing_lecture = repository.find_lecture_by_name(module_id, lecture_name)
+                                        if existing_lecture is not None:
+                                            repository.update_lecture(
+                                                existing_lecture.id,
+                                                description=lecture_description if lecture_description else None,
+                                            )
+                                            asset_updates = {
+                                                key: value
+                                                for key, value in assets.items()
+                                                if value
+                                            }
+                                            if asset_updates:
+                                                repository.update_lecture_assets(existing_lecture.id, **asset_updates)
+                                            continue
+
+                                    try:
+                                        lecture_id = repository.add_lecture(
+                                            module_id,
+                                            lecture_name,
+                                            lecture_description,
+                                            position=next(positions),
+                                            audio_path=assets["audio_path"],
+                                            slide_path=assets["slide_path"],
+                                            transcript_path=assets["transcript_path"],
+                                            notes_path=assets["notes_path"],
+                                            slide_image_dir=assets["slide_image_dir"],
+                                        )
+                                    except sqlite3.IntegrityError:
+                                        existing = repository.find_lecture_by_name(module_id, lecture_name)
+                                        if existing is None:
+                                            raise
+                                        repository.update_lecture(
+                                            existing.id,
+                                            description=lecture_description if lecture_description else None,
+                                        )
+                                        asset_updates = {key: value for key, value in assets.items() if value}
+                                        if asset_updates:
+                                            repository.update_lecture_assets(existing.id, **asset_updates)
+                                        lecture_id = existing.id
+                                    imported_lectures += 1
+
+                return imported_classes, imported_modules, imported_lectures
+
+            imported_classes, imported_modules, imported_lectures = await asyncio.to_thread(
+                _merge_metadata
+            )
 
         _log_event(
             "Imported archive",
@@ -5481,10 +5796,16 @@ def create_app(
         if lecture is None:
             raise HTTPException(status_code=404, detail="Lecture not found")
 
-        transcript_preview = _safe_preview_for_path(
-            config.storage_root, lecture.transcript_path
+        # Both previews hit the disk, so read them in worker threads rather
+        # than stalling the event loop while another request is waiting.
+        transcript_preview, notes_preview = await asyncio.gather(
+            asyncio.to_thread(
+                _safe_preview_for_path, config.storage_root, lecture.transcript_path
+            ),
+            asyncio.to_thread(
+                _safe_preview_for_path, config.storage_root, lecture.notes_path
+            ),
         )
-        notes_preview = _safe_preview_for_path(config.storage_root, lecture.notes_path)
         _log_event(
             "Preview prepared",
             lecture_id=lecture_id,
@@ -6236,13 +6557,12 @@ def create_app(
         preview_path = preview_dir / preview_name
 
         if source_mode == "existing":
-            with existing_slide.open("rb") as origin, preview_path.open("wb") as buffer:
-                shutil.copyfileobj(origin, buffer)
+            # copyfile uses the platform fast path (sendfile / fcopyfile) where available.
+            await asyncio.to_thread(shutil.copyfile, existing_slide, preview_path)
         else:
             assert file is not None  # for type checkers
             try:
-                with preview_path.open("wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
+                await _persist_upload_file(file, preview_path)
             finally:
                 await file.close()
 
@@ -6379,7 +6699,7 @@ def create_app(
 
         try:
             payload = await asyncio.to_thread(
-                render_pdf_page,
+                _render_preview_page,
                 preview_path,
                 page_number,
                 dpi=200,
@@ -6609,8 +6929,7 @@ def create_app(
                 slide_destination = lecture_paths.raw_dir / slide_filename
                 slide_destination.parent.mkdir(parents=True, exist_ok=True)
                 try:
-                    with slide_destination.open("wb") as buffer:
-                        shutil.copyfileobj(file.file, buffer)
+                    await _persist_upload_file(file, slide_destination)
                 finally:
                     await file.close()
                 slide_relative = slide_destination.relative_to(storage_root).as_posix()
@@ -6801,13 +7120,16 @@ def create_app(
         directory_size = _calculate_directory_size(root_path)
         largest_entries: List[Dict[str, Any]] = []
         try:
-            children = list(root_path.iterdir())
+            with os.scandir(root_path) as scanned:
+                children = list(scanned)
         except (FileNotFoundError, PermissionError, OSError):
             children = []
 
         for child in children:
             try:
-                entry = _build_storage_entry(child)
+                entry = _build_storage_entry(
+                    Path(child.path), child.stat(follow_symlinks=False)
+                )
             except (OSError, ValueError):
                 continue
             try:
@@ -6881,11 +7203,16 @@ def create_app(
 
         entries: List[StorageEntry] = []
         try:
-            for child in target.iterdir():
-                try:
-                    entries.append(_build_storage_entry(child))
-                except (OSError, ValueError):
-                    continue
+            with os.scandir(target) as scanned:
+                for child in scanned:
+                    try:
+                        entries.append(
+                            _build_storage_entry(
+                                Path(child.path), child.stat(follow_symlinks=False)
+                            )
+                        )
+                    except (OSError, ValueError):
+                        continue
         except (OSError, PermissionError, FileNotFoundError):
             entries = []
 
@@ -6914,15 +7241,27 @@ def create_app(
         if not normalized_paths:
             raise HTTPException(status_code=400, detail="No storage paths selected")
 
-        root_path = _require_storage_root().resolve()
+        root_path = _resolved_storage_root(_require_storage_root())
         archive_root = config.archive_root
         archive_root.mkdir(parents=True, exist_ok=True)
 
         filename = build_timestamped_name("storage-selection", extension="zip")
         archive_path = archive_root / filename
 
-        written: Set[Path] = set()
+        written: Set[str] = set()
         file_count = 0
+        resolved_archive = archive_path.resolve()
+        # Every bundled path sits under the resolved root, so relative names
+        # can be sliced off the string form instead of rebuilt per file. The
+        # join only appends a separator when the root does not already end in
+        # one (e.g. a filesystem or drive root).
+        root_prefix_length = len(os.path.join(str(root_path), ""))
+
+        def _bundle_name(path: Path) -> str:
+            relative = str(path)[root_prefix_length:]
+            if os.sep != "/":
+                relative = relative.replace(os.sep, "/")
+            return relative
 
         try:
             with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
@@ -6939,30 +7278,35 @@ def create_app(
                         continue
 
                     if target.is_dir():
-                        for child in target.rglob("*"):
-                            if child.is_dir():
-                                continue
-                            if child.resolve() == archive_path.resolve():
+                        for entry in _iter_file_entries(target, follow_file_symlinks=True):
+                            child = Path(entry.path)
+                            if child.resolve() == resolved_archive:
                                 continue
-                            relative_child = child.relative_to(root_path)
+                            relative_child = _bundle_name(child)
                             if relative_child in written:
                                 continue
-                            bundle.write(
-                                child,
-                                (Path("storage") / relative_child).as_posix(),
-                            )
+                            if _is_database_artifact(child):
+                                if not _write_database_snapshot(
+                                    bundle, child, f"storage/{relative_child}"
+                                ):
+                                    continue
+                            else:
+                                bundle.write(child, f"storage/{relative_child}")
                             written.add(relative_child)
                             file_count += 1
                     else:
-                        if target.resolve() == archive_path.resolve():
+                        if target == resolved_archive:
                             continue
-                        relative_file = target.relative_to(root_path)
+                        relative_file = _bundle_name(target)
                         if relative_file in written:
                             continue
-                        bundle.write(
-                            target,
-                            (Path("storage") / relative_file).as_posix(),
-                        )
+                        if _is_database_artifact(target):
+                            if not _write_database_snapshot(
+                                bundle, target, f"storage/{relative_file}"
+                            ):
+                                continue
+                        else:
+                            bundle.write(target, f"storage/{relative_file}")
                         written.add(relative_file)
                         file_count += 1
         except OSError as error:
@@ -7022,7 +7366,7 @@ def create_app(
             slug = slugify(label or "")
             return slug or fallback
 
-        root_path = _require_storage_root().resolve()
+        root_path = _resolved_storage_root(_require_storage_root())
         archive_root = config.archive_root
         archive_root.mkdir(parents=True, exist_ok=True)
 
@@ -7184,7 +7528,7 @@ def create_app(
         _log_event("Building storage overview")
         classes: List[ClassStorageSummary] = []
         eligible_total = 0
-        root_path = _require_storage_root().resolve()
+        root_path = _resolved_storage_root(_require_storage_root())
 
         for class_record in repository.iter_classes():
             modules: List[ModuleStorageSummary] = []
@@ -7306,6 +7650,9 @@ def create_app(
         if not target.exists():
             raise HTTPException(status_code=404, detail="Path not found")
 
+        if _contains_database_artifact(target):
+            raise HTTPException(status_code=400, detail="Cannot delete the live database")
+
         _delete_storage_path(target)
 
         _log_event("Deleted storage path", path=payload.path)
@@ -7340,7 +7687,7 @@ def create_app(
     @app.post("/api/storage/repair")
     async def repair_storage() -> Dict[str, Any]:
         _log_event("Repairing storage")
-        root_path = _require_storage_root().resolve()
+        root_path = _resolved_storage_root(_require_storage_root())
         archive_root = config.archive_root.resolve()
 
         oversize_factor_value = getattr(config, "storage_repair_oversize_factor", 5.0)
@@ -7449,7 +7796,11 @@ def create_app(
 
         def _safe_delete(target: Path, *, kind: str, description: str) -> None:
             resolved = _normalize(target)
-            if not resolved.exists():
+            # One lstat covers the existence check, the directory test, the
+            # size and the removal below.
+            try:
+                info = resolved.lstat()
+            except OSError:
                 return
             if _is_path_protected(resolved) or _contains_reference(resolved):
                 skipped.append(
@@ -7460,16 +7811,12 @@ def create_app(
                     }
                 )
                 return
+            if stat.S_ISDIR(info.st_mode):
+                size = _calculate_directory_size(resolved)
+            else:
+                size = info.st_size
             try:
-                size = (
-                    _calculate_directory_size(resolved)
-                    if resolved.is_dir()
-                    else resolved.stat().st_size
-                )
-            except (OSError, ValueError):
-                size = 0
-            try:
-                _delete_storage_path(resolved)
+                _delete_storage_path(resolved, info)
             except (OSError, ValueError) as error:
                 skipped.append(
                     {
@@ -7535,7 +7882,7 @@ def create_app(
             "previews",
             ".ipynb_checkpoints",
         }
-        TEMP_FILE_NAMES = {".ds_store", "thumbs.db", "desktop.ini"}
+        TEMP_FILE_NAMES = frozenset({".ds_store", "thumbs.db", "desktop.ini"})
         TEMP_SUFFIXES = (
             ".tmp",
             ".temp",
@@ -7574,7 +7921,7 @@ def create_app(
         DATED_TMP_PATTERN = re.compile(r"^(?:tmp|temp)[-_]?\d{4}(?:[-_]\d{2}){2}(?:[-_]\d+)?$")
         PREVIEW_KEYWORDS = (".previews", "_previews", "previews")
         AGGRESSIVE_IMAGE_PREFIXES = ("render-", "preview-", "slide-")
-        AGGRESSIVE_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+        AGGRESSIVE_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
 
         def _cleanup_temporary_entries(
             base: Path,
@@ -7601,7 +7948,7 @@ def create_app(
                         )
                         continue
                     has_prefix = any(check(name_lower) for check in TEMP_PREFIX_CHECKS)
-                    matches_suffix = any(name_lower.endswith(suffix) for suffix in TEMP_SUFFIXES)
+                    matches_suffix = name_lower.endswith(TEMP_SUFFIXES)
                     matches_numeric = bool(
                         NUMERIC_TMP_PATTERN.match(name_lower)
                         or DATED_TMP_PATTERN.match(name_lower)
@@ -7642,14 +7989,11 @@ def create_app(
                     if _is_referenced_path(normalized_child, references):
                         continue
                     has_prefix = any(check(name_lower) for check in TEMP_PREFIX_CHECKS)
-                    has_suffix = any(name_lower.endswith(suffix) for suffix in TEMP_SUFFIXES)
+                    has_suffix = name_lower.endswith(TEMP_SUFFIXES)
                     aggressive_preview = False
                     suffix_lower = child.suffix.lower()
                     if aggressive and suffix_lower in AGGRESSIVE_IMAGE_SUFFIXES:
-                        aggressive_preview = any(
-                            name_lower.startswith(prefix)
-                            for prefix in AGGRESSIVE_IMAGE_PREFIXES
-                        )
+                        aggressive_preview = name_lower.startswith(AGGRESSIVE_IMAGE_PREFIXES)
                     if (
                         name_lower in TEMP_FILE_NAMES
                         or has_prefix
@@ -7684,13 +8028,12 @@ def create_app(
                 suffix_lower = normalized_candidate.suffix.lower()
                 if (
                     name_lower in TEMP_FILE_NAMES
-                    or any(name_lower.endswith(suffix) for suffix in TEMP_SUFFIXES)
+                    or name_lower.endswith(TEMP_SUFFIXES)
                 ):
                     description = f"Temporary file '{normalized_candidate.name}'"
                     kind = "temporary"
-                    if suffix_lower in AGGRESSIVE_IMAGE_SUFFIXES and any(
-                        name_lower.startswith(prefix)
-                        for prefix in AGGRESSIVE_IMAGE_PREFIXES
+                    if suffix_lower in AGGRESSIVE_IMAGE_SUFFIXES and name_lower.startswith(
+                        AGGRESSIVE_IMAGE_PREFIXES
                     ):
                         kind = "oversized_preview"
                         description = f"Preview artifact '{normalized_candidate.name}'"
@@ -7878,10 +8221,10 @@ def create_app(
                         if normalized_file.is_symlink():
                             continue
                         try:
-                            stat = normalized_file.stat()
+                            file_info = normalized_file.stat()
                         except (OSError, FileNotFoundError, PermissionError):
                             continue
-                        size = stat.st_size
+                        size = file_info.st_size
                         total_size += size
                         suffix_lower = normalized_file.suffix.lower()
                         referenced = _is_file_referenced(
@@ -8140,14 +8483,13 @@ def create_app(
                         and not _contains_reference(normalized_child)
                         and (
                             name_lower in TEMP_FILE_NAMES
-                            or any(name_lower.endswith(suffix) for suffix in TEMP_SUFFIXES)
+                            or name_lower.endswith(TEMP_SUFFIXES)
                         )
                     ):
                         description = f"Temporary file '{child.name}'"
                         kind = "temporary"
-                        if suffix_lower in AGGRESSIVE_IMAGE_SUFFIXES and any(
-                            name_lower.startswith(prefix)
-                            for prefix in AGGRESSIVE_IMAGE_PREFIXES
+                        if suffix_lower in AGGRESSIVE_IMAGE_SUFFIXES and name_lower.startswith(
+                            AGGRESSIVE_IMAGE_PREFIXES
                         ):
                             kind = "oversized_preview"
                             description = f"Preview artifact '{child.name}'"
@@ -12,6 +12,7 @@ from app.config import AppConfig
 from app.services.ingestion import (
     IngestionError,
     LectureIngestor,
+    LecturePaths,
     SlideConversionResult,
     SlideConverter,
     TranscriptResult,
@@ -150,6 +151,8 @@ def test_ingestion_combines_multiple_assets(
         names = archive.namelist()
         assert any(name.startswith("part_01/") for name in names)
         assert any(name.startswith("part_02/") for name in names)
+        assert archive.read("part_02/slides.md").decode("utf-8") == "# Dummy slides\n"
+        assert archive.testzip() is None
 
     assert lecture.notes_path is not None
     notes_file = temp_config.storage_root / lecture.notes_path
@@ -207,3 +210,33 @@ def test_ingestion_detects_unwritable_directories(
     message = str(exc_info.value)
     assert "transcript" in message.lower()
     assert "not writable" in message.lower()
+
+
+def test_lecture_paths_ensure_skips_prepared_directories(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import app.services.ingestion as ingestion_module
+
+    checked: list[Path] = []
+    original = ingestion_module.config_module._ensure_writable_directory
+
+    def tracking_ensure(path: Path) -> bool:
+        checked.append(path)
+        return original(path)
+
+    monkeypatch.setattr(
+        ingestion_module.config_module, "_ensure_writable_directory", tracking_ensure
+    )
+    lecture_paths = LecturePaths.build(tmp_path, "Physics", "Optics", "Refraction")
+
+    lecture_paths.ensure()
+    assert len(checked) == 7
+
+    lecture_paths.ensure()
+    assert len(checked) == 7
+
+    lecture_paths.notes_dir.rmdir()
+    lecture_paths.ensure()
+    assert len(checked) == 14
+    assert lecture_paths.notes_dir.is_dir()
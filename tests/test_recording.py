@@ -11,6 +11,7 @@ from app.processing.recording import (
     load_wav_file,
     preprocess_audio,
     save_preprocessed_wav,
+    _compress_signal,
     _shape_frequency_response,
 )
 
@@ -161,3 +162,42 @@ def test_frequency_shaping_operates_in_frames() -> None:
 
     assert presence_mag > low_mag * 3
     assert presence_mag > high_mag * 1.8
+
+
+def test_compressor_attenuates_only_signal_above_threshold() -> None:
+    sample_rate = 16_000
+    quiet = np.full(sample_rate // 2, 0.05, dtype=np.float32)
+    loud = np.full(sample_rate // 2, 0.9, dtype=np.float32)
+    signal = np.concatenate([quiet, loud])
+
+    compressed = _compress_signal(
+        signal,
+        sample_rate,
+        threshold_db=-12.0,
+        ratio=4.0,
+        attack_ms=5.0,
+        release_ms=50.0,
+    )
+
+    assert compressed.dtype == np.float32
+    assert compressed.shape == signal.shape
+    np.testing.assert_allclose(compressed[: quiet.size], quiet)
+    threshold = 10 ** (-12.0 / 20)
+    expected_tail = threshold * (0.9 / threshold) ** 0.25
+    assert abs(float(compressed[-1]) - expected_tail) < 1e-3
+
+
+def test_compressor_passes_quiet_signal_through_unchanged() -> None:
+    quiet = np.full(1_000, 0.05, dtype=np.float32)
+
+    compressed = _compress_signal(
+        quiet,
+        16_000,
+        threshold_db=-12.0,
+        ratio=4.0,
+        attack_ms=5.0,
+        release_ms=50.0,
+    )
+
+    assert compressed.dtype == np.float32
+    np.testing.assert_array_equal(compressed, quiet)
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import threading
+
 from app.config import AppConfig
-from app.services.storage import LectureRepository
+from app.services import storage
+from app.services.storage import (
+    ClassRecord,
+    LectureRecord,
+    LectureRepository,
+    LectureTreeRow,
+    ModuleRecord,
+)
 
 
 def test_repository_crud_cycle(temp_config: AppConfig) -> None:
@@ -82,7 +91,7 @@ def test_repository_lookup_helpers(temp_config: AppConfig) -> None:
     assert module_record is not None and module_record.id == module_id
     assert lecture_record is not None and lecture_record.id == lecture_id
 
-    repository.update_lecture_description(lecture_id, "Differential calculus")
+    repository.update_lecture(lecture_id, description="Differential calculus")
     repository.update_lecture_assets(
         lecture_id,
         audio_path="raw/derivatives.mp3",
@@ -180,3 +189,222 @@ def test_insert_and_rename_lectures(temp_config: AppConfig) -> None:
 
     final_names = [lecture.name for lecture in repository.iter_lectures(module_id)]
     assert final_names == desired_order
+
+
+def test_batch_insert_assigns_sequential_positions(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    class_id = repository.add_class("Economics")
+    module_id = repository.add_module(class_id, "Macroeconomics")
+    repository.add_lecture(module_id, "Inflation")
+
+    with repository.batch_insert(module_id) as positions:
+        for name in ("Interest Rates", "Unemployment", "Trade"):
+            repository.add_lecture(module_id, name, position=next(positions))
+
+    lectures = list(repository.iter_lectures(module_id))
+    assert [lecture.name for lecture in lectures] == [
+        "Inflation",
+        "Interest Rates",
+        "Unemployment",
+        "Trade",
+    ]
+    assert [lecture.position for lecture in lectures] == [0, 1, 2, 3]
+
+
+def test_repository_reuses_connection_per_thread(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    connection = repository._connect()
+    assert repository._connect() is connection
+
+    other: list = []
+    worker = threading.Thread(target=lambda: other.append(repository._connect()))
+    worker.start()
+    worker.join()
+    assert other and other[0] is not connection
+
+    repository.close()
+    assert repository._connect() is not connection
+
+
+def test_update_lecture_moves_to_end_of_target_module(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    class_id = repository.add_class("Chemistry")
+    organic_id = repository.add_module(class_id, "Organic")
+    inorganic_id = repository.add_module(class_id, "Inorganic")
+    repository.add_lecture(inorganic_id, "Metals")
+    repository.add_lecture(inorganic_id, "Salts")
+    lecture_id = repository.add_lecture(organic_id, "Alkanes", description="Intro")
+
+    repository.update_lecture(lecture_id, name="Alkanes & Alkenes", module_id=inorganic_id)
+
+    moved = repository.get_lecture(lecture_id)
+    assert moved is not None
+    assert moved.name == "Alkanes & Alkenes"
+    assert moved.description == "Intro"
+    assert moved.module_id == inorganic_id
+    assert moved.position == 2
+
+    repository.update_lecture(lecture_id, module_id=inorganic_id)
+    unchanged = repository.get_lecture(lecture_id)
+    assert unchanged is not None and unchanged.position == 2
+
+    repository.update_lecture(9999, name="Missing")
+    assert repository.find_lecture_by_name(inorganic_id, "Missing") is None
+
+
+def test_iter_full_tree_flattens_hierarchy(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    biology_id = repository.add_class("Biology")
+    repository.add_class("Geology")
+    cells_id = repository.add_module(biology_id, "Cells")
+    repository.add_module(biology_id, "Genetics")
+    repository.add_lecture(cells_id, "Membranes", audio_path="raw/membranes.mp3")
+    repository.add_lecture(cells_id, "Organelles", notes_path="notes/organelles.docx")
+
+    rows = list(repository.iter_full_tree())
+
+    assert [(row.class_name, row.module_name, row.lecture_name) for row in rows] == [
+        ("Biology", "Cells", "Membranes"),
+        ("Biology", "Cells", "Organelles"),
+        ("Biology", "Genetics", None),
+        ("Geology", None, None),
+    ]
+    assert rows[0].has_audio and not rows[0].has_notes
+    assert rows[1].has_notes and not rows[1].has_audio
+
+
+def test_iter_all_modules_and_lectures_group_by_parent(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    biology_id = repository.add_class("Biology")
+    geology_id = repository.add_class("Geology")
+    rocks_id = repository.add_module(geology_id, "Rocks")
+    cells_id = repository.add_module(biology_id, "Cells")
+    genetics_id = repository.add_module(biology_id, "Genetics")
+    repository.add_lecture(genetics_id, "Heredity")
+    repository.add_lecture(cells_id, "Membranes")
+    repository.add_lecture(rocks_id, "Minerals")
+    repository.add_lecture(cells_id, "Organelles")
+    repository.reorder_modules({biology_id: [genetics_id, cells_id]})
+
+    modules = repository.iter_all_modules()
+    lectures = repository.iter_all_lectures()
+
+    assert [(module.class_id, module.name) for module in modules] == [
+        (biology_id, "Genetics"),
+        (biology_id, "Cells"),
+        (geology_id, "Rocks"),
+    ]
+    assert [(lecture.module_id, lecture.name) for lecture in lectures] == sorted(
+        [
+            (rocks_id, "Minerals"),
+            (cells_id, "Membranes"),
+            (cells_id, "Organelles"),
+            (genetics_id, "Heredity"),
+        ],
+        key=lambda item: item[0],
+    )
+
+
+def test_record_fields_match_select_column_order(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+    connection = repository._connect()
+
+    for statement, record_type in (
+        (storage._SQL_GET_CLASS, ClassRecord),
+        (storage._SQL_GET_MODULE, ModuleRecord),
+        (storage._SQL_GET_LECTURE, LectureRecord),
+    ):
+        cursor = connection.execute(statement, (0,))
+        assert tuple(column[0] for column in cursor.description) == record_type._fields
+
+    cursor = connection.execute(storage._SQL_ITER_FULL_TREE)
+    assert tuple(column[0] for column in cursor.description) == LectureTreeRow._fields
+
+
+def test_listing_queries_use_position_indexes(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+    connection = repository._connect()
+
+    for statement, index_name in (
+        (storage._SQL_ITER_CLASSES, "idx_classes_pos"),
+        (storage._SQL_ITER_MODULES, "idx_modules_class_pos"),
+        (storage._SQL_ITER_LECTURES, "idx_lectures_module_pos"),
+    ):
+        parameters = (1,) if "?" in statement else ()
+        plan = " ".join(
+            row[-1]
+            for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        )
+        assert index_name in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_reorder_lectures_spans_multiple_batches(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    class_id = repository.add_class("Literature")
+    first_id = repository.add_module(class_id, "Poetry")
+    second_id = repository.add_module(class_id, "Prose")
+    total = storage._REORDER_BATCH_SIZE + 5
+    with repository.batch_insert(first_id) as positions:
+        lecture_ids = [
+            repository.add_lecture(first_id, f"Lecture {index}", position=next(positions))
+            for index in range(total)
+        ]
+
+    moved = lecture_ids[:3]
+    remaining = list(reversed(lecture_ids[3:]))
+    repository.reorder_lectures({first_id: remaining, second_id: moved})
+
+    assert [lecture.id for lecture in repository.iter_lectures(first_id)] == remaining
+    assert [lecture.id for lecture in repository.iter_lectures(second_id)] == moved
+    assert [lecture.position for lecture in repository.iter_lectures(second_id)] == [0, 1, 2]
+
+
+def test_reorder_lectures_last_duplicate_wins_across_batches(
+    temp_config: AppConfig, monkeypatch
+) -> None:
+    repository = LectureRepository(temp_config)
+
+    class_id = repository.add_class("Drama")
+    first_id = repository.add_module(class_id, "Tragedy")
+    second_id = repository.add_module(class_id, "Comedy")
+    lecture_ids = [repository.add_lecture(first_id, f"Act {index}") for index in range(3)]
+    repeated = lecture_ids[0]
+
+    for batch_size in (2, 300):
+        monkeypatch.setattr(storage, "_REORDER_BATCH_SIZE", batch_size)
+        repository.reorder_lectures(
+            {first_id: [repeated, *lecture_ids[1:]], second_id: [repeated]}
+        )
+
+        assert [lecture.id for lecture in repository.iter_lectures(second_id)] == [repeated]
+        assert repository.get_lecture(repeated).position == 0
+        assert [lecture.id for lecture in repository.iter_lectures(first_id)] == lecture_ids[1:]
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(temp_config: AppConfig) -> None:
+    repository = LectureRepository(temp_config)
+
+    with repository.transaction() as unit:
+        class_id = unit.add_class("Astronomy")
+        with unit.transaction():
+            module_id = unit.add_module(class_id, "Stars")
+        assert repository._connect().in_transaction
+        unit.add_lecture(module_id, "Main Sequence")
+    assert not repository._connect().in_transaction
+    assert repository.find_lecture_by_name(module_id, "Main Sequence") is not None
+
+    try:
+        with repository.transaction():
+            repository.add_module(class_id, "Galaxies")
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert repository.find_module_by_name(class_id, "Galaxies") is None
+    assert [module.name for module in repository.iter_modules(class_id)] == ["Stars"]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import shutil
+import sqlite3
 import subprocess
 import zipfile
 from pathlib import Path
@@ -362,6 +363,32 @@ def test_storage_batch_download_creates_archive(temp_config):
         assert archive_info["count"] == 2
 
 
+def test_storage_endpoints_protect_live_database(temp_config, tmp_path):
+    repository = LectureRepository(temp_config)
+    class_id = repository.add_class("Physics")
+    app = create_app(repository, config=temp_config)
+    client = TestClient(app)
+
+    database_relative = temp_config.database_file.relative_to(
+        temp_config.storage_root
+    ).as_posix()
+    response = client.request("DELETE", "/api/storage", json={"path": database_relative})
+    assert response.status_code == 400
+    assert temp_config.database_file.exists()
+
+    response = client.post("/api/storage/download", json={"paths": [database_relative]})
+    assert response.status_code == 200
+    archive_path = temp_config.storage_root / response.json()["archive"]["path"]
+
+    snapshot_path = tmp_path / "snapshot.db"
+    with zipfile.ZipFile(archive_path, "r") as bundle:
+        assert not any(name.endswith(("-wal", "-shm")) for name in bundle.namelist())
+        snapshot_path.write_bytes(bundle.read(f"storage/{database_relative}"))
+    with sqlite3.connect(snapshot_path) as connection:
+        rows = connection.execute("SELECT id, name FROM classes").fetchall()
+    assert rows == [(class_id, "Physics")]
+
+
 def test_storage_batch_download_requires_selection(temp_config):
     repository = LectureRepository(temp_config)
     app = create_app(repository, config=temp_config)
@@ -2669,3 +2696,134 @@ def test_whisper_benchmark_endpoint_runs_all_models_with_stub_engine(temp_config
         "medium",
         "large",
     }
+
+
+def test_slide_manifest_count_refreshes_when_manifest_changes(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "slides_manifest.json"
+    assert web_server._slide_manifest_count(manifest_path) is None
+
+    manifest_path.write_text(json.dumps([{"path": "a.pdf"}]), encoding="utf-8")
+    assert web_server._slide_manifest_count(manifest_path) == 1
+    assert web_server._slide_manifest_count(manifest_path) == 1
+
+    manifest_path.write_text(
+        json.dumps([{"path": "a.pdf"}, {"path": "b.pdf"}, {"name": "skipped"}]),
+        encoding="utf-8",
+    )
+    assert web_server._slide_manifest_count(manifest_path) == 2
+
+    manifest_path.unlink()
+    assert web_server._slide_manifest_count(manifest_path) is None
+
+
+def test_iter_file_entries_walks_nested_files_without_following_symlinks(
+    tmp_path: Path,
+) -> None:
+    nested = tmp_path / "module" / "lecture"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.txt").write_text("a", encoding="utf-8")
+    (nested / "slide.png").write_bytes(b"png")
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    (outside / "hidden.txt").write_text("b", encoding="utf-8")
+    try:
+        (tmp_path / "link").symlink_to(outside, target_is_directory=True)
+        (tmp_path / "linked.txt").symlink_to(outside / "hidden.txt")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported here")
+
+    def _walk(**kwargs: Any) -> list[str]:
+        return sorted(
+            Path(entry.path).relative_to(tmp_path).as_posix()
+            for entry in web_server._iter_file_entries(tmp_path, **kwargs)
+        )
+
+    assert _walk() == ["module/lecture/slide.png", "top.txt"]
+    # Linked files are kept on request, but linked directories are never walked.
+    assert _walk(follow_file_symlinks=True) == [
+        "linked.txt",
+        "module/lecture/slide.png",
+        "top.txt",
+    ]
+
+
+def test_copy_upload_stream_handles_spooled_and_in_memory_uploads(tmp_path: Path) -> None:
+    from tempfile import SpooledTemporaryFile
+
+    from fastapi import UploadFile
+
+    payload = bytes(range(256)) * 4096
+    for max_size, name in ((1024, "spooled.bin"), (len(payload) * 2, "memory.bin")):
+        spool = SpooledTemporaryFile(max_size=max_size)
+        spool.write(payload)
+        target = tmp_path / name
+        web_server._copy_upload_stream(UploadFile(spool, filename=name), target)
+        assert target.read_bytes() == payload
+
+    # Small uploads stay in memory rather than being spooled to disk first.
+    spool = SpooledTemporaryFile(max_size=len(payload) * 2)
+    spool.write(payload)
+    target = tmp_path / "small.bin"
+    web_server._copy_upload_stream(UploadFile(spool, filename="small.bin"), target)
+    assert target.read_bytes() == payload
+    assert spool._rolled is False
+
+    # Streams without a file descriptor fall back to chunked copying.
+    target = tmp_path / "stream.bin"
+    web_server._copy_upload_stream(UploadFile(io.BytesIO(payload), filename="stream.bin"), target)
+    assert target.read_bytes() == payload
+
+
+def test_slide_preview_page_render_is_cached(temp_config, monkeypatch):
+    repository, lecture_id, _module_id = _create_sample_data(temp_config)
+    app = create_app(repository, config=temp_config)
+    client = TestClient(app)
+
+    response = client.post(
+        f"/api/lectures/{lecture_id}/slides/previews",
+        files={"file": ("deck.pdf", _build_sample_pdf(2), "application/pdf")},
+    )
+    assert response.status_code == 201
+    preview_id = response.json()["preview_id"]
+
+    calls: list[int] = []
+
+    def fake_render(_path, page_number, *, dpi):
+        calls.append(page_number)
+        return f"page-{page_number}".encode()
+
+    monkeypatch.setattr(web_server, "render_pdf_page", fake_render)
+    monkeypatch.setattr(web_server, "_PREVIEW_PAGE_CACHE", web_server.OrderedDict())
+    monkeypatch.setattr(web_server, "_PREVIEW_PAGE_CACHE_BYTES", 0)
+
+    url = f"/api/lectures/{lecture_id}/slides/previews/{preview_id}/pages"
+    assert client.get(f"{url}/1").content == b"page-1"
+    assert client.get(f"{url}/2").content == b"page-2"
+    assert client.get(f"{url}/1").content == b"page-1"
+
+    assert calls == [1, 2]
+
+    # Two six-byte pages fit the budget; a third evicts the least recent one.
+    monkeypatch.setattr(web_server, "_PREVIEW_PAGE_CACHE_MAX_BYTES", 12)
+    assert client.get(f"{url}/3").content == b"page-3"
+    assert client.get(f"{url}/1").content == b"page-1"
+    assert client.get(f"{url}/2").content == b"page-2"
+
+    assert calls == [1, 2, 3, 2]
+    assert web_server._PREVIEW_PAGE_CACHE_BYTES == sum(
+        len(page) for page in web_server._PREVIEW_PAGE_CACHE.values()
+    )
+
+
+def test_slide_manifest_count_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(web_server, "_SLIDE_MANIFEST_COUNT_CACHE", web_server.OrderedDict())
+    monkeypatch.setattr(web_server, "_SLIDE_MANIFEST_COUNT_CACHE_MAX_ENTRIES", 2)
+
+    manifests = []
+    for index in range(3):
+        manifest = tmp_path / f"slides_{index}.json"
+        manifest.write_text(json.dumps([{"path": "a.png"}] * (index + 1)), encoding="utf-8")
+        manifests.append(manifest)
+
+    assert [web_server._slide_manifest_count(path) for path in manifests] == [1, 2, 3]
+    assert list(web_server._SLIDE_MANIFEST_COUNT_CACHE) == [str(manifests[1]), str(manifests[2])]